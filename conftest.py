@@ -0,0 +1,4 @@
+# Ancre pytest à la racine du projet: en mode d'import « prepend », ce
+# fichier place la racine sur sys.path et rend le paquet counter_agent
+# importable par la suite de tests sans installation préalable
+# (pip install -e .) ni manipulation de sys.path dans les tests.
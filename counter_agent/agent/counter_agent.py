@@ -6,7 +6,7 @@ Ce module implémente l'agent principal pour la génération de contre-arguments
 
 import logging
 import json
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Iterator, List, Dict, Any, Optional, Tuple
 
 from .definitions import (
     Argument, 
@@ -29,6 +29,9 @@ from ..evaluation.metrics import PerformanceMetrics, MetricsTracker
 
 logger = logging.getLogger(__name__)
 
+# Taille maximale du cache d'analyses d'arguments (éviction du plus ancien)
+_ANALYZE_CACHE_MAX_ENTRIES = 512
+
 
 class CounterArgumentAgent:
     """
@@ -64,6 +67,12 @@ class CounterArgumentAgent:
         self.metrics = PerformanceMetrics()
         self.metrics_tracker = MetricsTracker(self.metrics)
         
+        # Mémoïsation des analyses: les tests et les points d'entrée web
+        # soumettent souvent exactement le même texte; la clé est normalisée
+        # sur les blancs pour que l'indentation des chaînes multi-lignes ne
+        # crée pas d'entrées distinctes
+        self._analyze_cache: Dict[str, Argument] = {}
+        
         logger.info("CounterArgumentAgent initialisé")
     
     def analyze_argument(self, argument_text: str) -> Argument:
@@ -76,8 +85,19 @@ class CounterArgumentAgent:
         Returns:
             Un objet Argument contenant la structure de l'argument
         """
+        key = ' '.join(argument_text.split())
+        cached = self._analyze_cache.get(key)
+        if cached is not None:
+            logger.debug(f"Analyse en cache pour: {argument_text[:100]}...")
+            return cached
+        
         logger.info(f"Analyse d'un argument: {argument_text[:100]}...")
-        return self.parser.parse_argument(argument_text)
+        argument = self.parser.parse_argument(argument_text)
+        
+        if len(self._analyze_cache) >= _ANALYZE_CACHE_MAX_ENTRIES:
+            del self._analyze_cache[next(iter(self._analyze_cache))]
+        self._analyze_cache[key] = argument
+        return argument
     
     def identify_vulnerabilities(self, argument: Argument) -> List[Vulnerability]:
         """
@@ -96,51 +116,44 @@ class CounterArgumentAgent:
         self,
         argument_text_or_object,
         counter_type: Optional[CounterArgumentType] = None,
-        rhetorical_strategy: Optional[RhetoricalStrategy] = None
+        rhetorical_strategy: Optional[RhetoricalStrategy] = None,
+        record_metrics: bool = True
     ) -> Dict[str, Any]:
         """
         Génère un contre-argument pour un argument donné.
-        
+
         Args:
             argument_text_or_object: Le texte de l'argument ou un objet Argument
             counter_type: Le type de contre-argument à générer (optionnel)
             rhetorical_strategy: Stratégie rhétorique à utiliser (optionnel)
-            
+            record_metrics: Si False, la génération n'alimente pas les
+                métriques de performance (utile pour le travail spéculatif,
+                qui ne doit pas compter comme une requête utilisateur)
+
         Returns:
             Un dictionnaire contenant l'argument original, le contre-argument,
             l'évaluation et la validation
         """
-        # Convertir le texte en objet Argument si nécessaire
+        # Convertir le texte en objet Argument si nécessaire (analyse mémoïsée)
         if isinstance(argument_text_or_object, str):
-            argument = self.parser.parse_argument(argument_text_or_object)
+            argument = self.analyze_argument(argument_text_or_object)
         else:
             argument = argument_text_or_object
         
         # Identifier les vulnérabilités en utilisant le LLM au lieu de l'analyseur basique
         vulnerabilities_data = self.llm_generator.identify_vulnerabilities(argument)
-        
-        # Convertir les données du LLM en objets Vulnerability
-        vulnerabilities = []
-        for vuln_data in vulnerabilities_data:
-            try:
-                vulnerabilities.append(Vulnerability(
-                    type=vuln_data.get("type", "inconnu"),
-                    target=vuln_data.get("target", "inconnu"),
-                    description=vuln_data.get("description", ""),
-                    score=float(vuln_data.get("score", 0.5)),
-                    suggested_counter_type=CounterArgumentType(vuln_data.get("suggested_counter_type", "direct_refutation"))
-                ))
-            except (ValueError, TypeError) as e:
-                logger.warning(f"Erreur lors de la conversion d'une vulnérabilité: {e}")
+        vulnerabilities = self._convert_vulnerabilities(vulnerabilities_data)
         
         # Sélectionner le type de contre-argument si non spécifié
         if counter_type is None:
             counter_type = self._select_best_counter_type(argument, vulnerabilities)
             logger.info(f"Type de contre-argument sélectionné automatiquement: {counter_type.value}")
         
-        # Démarrer le suivi des métriques
-        self.metrics_tracker.start_tracking(counter_type)
-        
+        # Démarrer le suivi des métriques (le jeton porte l'état du suivi)
+        tracking_token = None
+        if record_metrics:
+            tracking_token = self.metrics_tracker.start_tracking(counter_type)
+
         try:
             # Utiliser le LLM pour générer le contre-argument
             counter_arg_data = self.llm_generator.generate_counter_argument(
@@ -167,8 +180,9 @@ class CounterArgumentAgent:
             validation = self.validator.validate(argument, counter_argument)
             
             # Arrêter le suivi des métriques
-            self.metrics_tracker.stop_tracking(evaluation, success=True)
-            
+            if record_metrics:
+                self.metrics_tracker.stop_tracking(tracking_token, evaluation, success=True)
+
             # Retourner les résultats
             return {
                 "original_argument": argument,
@@ -181,7 +195,100 @@ class CounterArgumentAgent:
         except Exception as e:
             logger.error(f"Erreur lors de la génération du contre-argument: {e}")
             # Arrêter le suivi des métriques avec échec
+            if record_metrics:
+                self.metrics_tracker.stop_tracking(
+                    tracking_token,
+                    EvaluationResult(
+                        relevance=0.0,
+                        logical_strength=0.0,
+                        persuasiveness=0.0,
+                        originality=0.0,
+                        clarity=0.0,
+                        overall_score=0.0,
+                        recommendations=["Erreur lors de la génération"]
+                    ),
+                    success=False
+                )
+            # Créer un contre-argument par défaut
+            return self._create_fallback_response(argument, counter_type, str(e))
+    
+    def generate_counter_argument_stream(
+        self,
+        argument_text_or_object,
+        counter_type: Optional[CounterArgumentType] = None,
+        rhetorical_strategy: Optional[RhetoricalStrategy] = None
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Génère un contre-argument en diffusant la rédaction au fil de l'eau.
+        
+        Générateur produisant des paires (genre, contenu): une paire
+        ('delta', str) pour chaque fragment de texte émis par le LLM pendant
+        la génération, puis une paire finale ('result', dict) au même format
+        que generate_counter_argument (évaluation et validation comprises).
+        
+        Args:
+            argument_text_or_object: Le texte de l'argument ou un objet Argument
+            counter_type: Le type de contre-argument à générer (optionnel)
+            rhetorical_strategy: Stratégie rhétorique à utiliser (optionnel)
+        """
+        # Convertir le texte en objet Argument si nécessaire (analyse mémoïsée)
+        if isinstance(argument_text_or_object, str):
+            argument = self.analyze_argument(argument_text_or_object)
+        else:
+            argument = argument_text_or_object
+        
+        # Même préparation que le chemin non diffusé
+        vulnerabilities_data = self.llm_generator.identify_vulnerabilities(argument)
+        vulnerabilities = self._convert_vulnerabilities(vulnerabilities_data)
+        
+        if counter_type is None:
+            counter_type = self._select_best_counter_type(argument, vulnerabilities)
+            logger.info(f"Type de contre-argument sélectionné automatiquement: {counter_type.value}")
+        
+        tracking_token = self.metrics_tracker.start_tracking(counter_type)
+
+        try:
+            # Relayer les fragments; le dernier élément du flux est le
+            # dictionnaire décodé complet
+            counter_arg_data = {}
+            for item in self.llm_generator.generate_counter_argument_stream(
+                argument, counter_type, vulnerabilities, rhetorical_strategy
+            ):
+                if isinstance(item, str):
+                    yield ('delta', item)
+                else:
+                    counter_arg_data = item
+            
+            counter_argument = CounterArgument(
+                original_argument=argument,
+                counter_type=counter_type,
+                counter_content=counter_arg_data.get("counter_argument", ""),
+                target_component=counter_arg_data.get("target_component", ""),
+                strength=ArgumentStrength(counter_arg_data.get("strength", "moderate")),
+                confidence=counter_arg_data.get("confidence", 0.8),
+                supporting_evidence=counter_arg_data.get("supporting_evidence", []),
+                rhetorical_strategy=counter_arg_data.get("rhetorical_strategy", 
+                                                        rhetorical_strategy.value if rhetorical_strategy else "")
+            )
+            
+            # Évaluer et valider comme sur le chemin non diffusé
+            evaluation = self.evaluator.evaluate(argument, counter_argument)
+            validation = self.validator.validate(argument, counter_argument)
+            
+            self.metrics_tracker.stop_tracking(tracking_token, evaluation, success=True)
+
+            yield ('result', {
+                "original_argument": argument,
+                "counter_argument": counter_argument,
+                "evaluation": evaluation,
+                "validation": validation,
+                "vulnerabilities": vulnerabilities
+            })
+            
+        except Exception as e:
+            logger.error(f"Erreur lors de la génération du contre-argument (flux): {e}")
             self.metrics_tracker.stop_tracking(
+                tracking_token,
                 EvaluationResult(
                     relevance=0.0,
                     logical_strength=0.0,
@@ -193,8 +300,34 @@ class CounterArgumentAgent:
                 ),
                 success=False
             )
-            # Créer un contre-argument par défaut
-            return self._create_fallback_response(argument, counter_type, str(e))
+            yield ('result', self._create_fallback_response(argument, counter_type, str(e)))
+    
+    def _convert_vulnerabilities(
+        self,
+        vulnerabilities_data: List[Dict[str, Any]]
+    ) -> List[Vulnerability]:
+        """
+        Convertit les données de vulnérabilités du LLM en objets Vulnerability.
+        
+        Args:
+            vulnerabilities_data: Liste de dictionnaires issus du LLM
+            
+        Returns:
+            Liste des vulnérabilités valides (les entrées malformées sont ignorées)
+        """
+        vulnerabilities = []
+        for vuln_data in vulnerabilities_data:
+            try:
+                vulnerabilities.append(Vulnerability(
+                    type=vuln_data.get("type", "inconnu"),
+                    target=vuln_data.get("target", "inconnu"),
+                    description=vuln_data.get("description", ""),
+                    score=float(vuln_data.get("score", 0.5)),
+                    suggested_counter_type=CounterArgumentType(vuln_data.get("suggested_counter_type", "direct_refutation"))
+                ))
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Erreur lors de la conversion d'une vulnérabilité: {e}")
+        return vulnerabilities
     
     def _select_best_counter_type(
         self, 
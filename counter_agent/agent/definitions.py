@@ -7,6 +7,7 @@ utilisées par l'agent de génération de contre-arguments.
 
 from enum import Enum
 from dataclasses import dataclass
+from functools import cached_property
 from typing import List, Dict, Optional, Any
 
 
@@ -45,6 +46,11 @@ class Argument:
     argument_type: str
     confidence: float
 
+    @cached_property
+    def premises_str(self) -> str:
+        """Liste des prémisses formatée pour les prompts (calculée une fois)."""
+        return "\n".join(f"- {p}" for p in self.premises)
+
 
 @dataclass
 class Vulnerability:
@@ -55,6 +61,14 @@ class Vulnerability:
     score: float
     suggested_counter_type: CounterArgumentType
 
+    @cached_property
+    def formatted(self) -> str:
+        """Description formatée pour les prompts (calculée une fois)."""
+        return (
+            f"- Type: {self.type}, Cible: {self.target}, Score: {self.score:.2f}, "
+            f"Description: {self.description}"
+        )
+
 
 @dataclass
 class CounterArgument:
@@ -13,6 +13,14 @@ from .definitions import Argument, Vulnerability, CounterArgumentType
 
 logger = logging.getLogger(__name__)
 
+# Nettoyage et mots vides pour l'extraction de mots clés (compilés une fois)
+_KEY_WORD_PUNCT_RE = re.compile(r'[^\w\s]')
+_STOP_WORDS = frozenset([
+    "le", "la", "les", "un", "une", "des", "et", "ou", "mais", "car", "donc",
+    "si", "que", "qui", "quoi", "comment", "quand", "où", "est", "sont", "a",
+    "ont", "être", "avoir"
+])
+
 
 class ArgumentParser:
     """Classe pour parser et analyser des arguments."""
@@ -369,6 +377,17 @@ class VulnerabilityAnalyzer:
             }
         }
         
+        # Alternation compilée par type de vulnérabilité: la détection se fait
+        # en un balayage C du texte par type au lieu d'une boucle Python de
+        # recherches de sous-chaînes motif par motif (termes longs d'abord
+        # pour que les variantes préfixes ne masquent pas les spécifiques)
+        self._vulnerability_res = {
+            vuln_type: re.compile(
+                '|'.join(re.escape(p) for p in sorted(info["patterns"], key=len, reverse=True))
+            )
+            for vuln_type, info in self.vulnerability_patterns.items()
+        }
+        
         logger.debug("VulnerabilityAnalyzer initialisé")
     
     def analyze_vulnerabilities(self, argument: Argument) -> List[Vulnerability]:
@@ -412,15 +431,15 @@ class VulnerabilityAnalyzer:
         text_lower = text.lower()
         
         for vuln_type, info in self.vulnerability_patterns.items():
-            for pattern in info["patterns"]:
-                if pattern in text_lower:
-                    return Vulnerability(
-                        type=vuln_type,
-                        target="",  # Sera rempli par l'appelant
-                        description=f"Contient '{pattern}', suggérant un {vuln_type}",
-                        score=0.7,
-                        suggested_counter_type=info["counter_type"]
-                    )
+            match = self._vulnerability_res[vuln_type].search(text_lower)
+            if match:
+                return Vulnerability(
+                    type=vuln_type,
+                    target="",  # Sera rempli par l'appelant
+                    description=f"Contient '{match.group(0)}', suggérant un {vuln_type}",
+                    score=0.7,
+                    suggested_counter_type=info["counter_type"]
+                )
         
         return None
     
@@ -463,10 +482,9 @@ class VulnerabilityAnalyzer:
     def _extract_key_words(self, text: str) -> List[str]:
         """Extrait les mots clés d'un texte."""
         # Supprimer la ponctuation et les mots vides
-        text = re.sub(r'[^\w\s]', '', text.lower())
-        stop_words = ["le", "la", "les", "un", "une", "des", "et", "ou", "mais", "car", "donc", "si", "que", "qui", "quoi", "comment", "quand", "où", "est", "sont", "a", "ont", "être", "avoir"]
+        text = _KEY_WORD_PUNCT_RE.sub('', text.lower())
         
-        return [word for word in text.split() if word not in stop_words]
+        return [word for word in text.split() if word not in _STOP_WORDS]
 
 
 def parse_llm_response(response: str) -> Dict[str, Any]:
@@ -21,6 +21,65 @@ from ..agent.definitions import (
 logger = logging.getLogger(__name__)
 
 
+def _compile_terms(terms: List[str]) -> "re.Pattern":
+    """
+    Compile une liste de termes en une alternation unique.
+
+    Un seul balayage C du texte remplace la boucle Python de recherches de
+    sous-chaînes terme par terme; les termes longs sont placés en premier
+    pour que les variantes préfixes ne masquent pas les plus spécifiques.
+    """
+    return re.compile('|'.join(re.escape(t) for t in sorted(terms, key=len, reverse=True)))
+
+
+# Motifs partagés, compilés une fois au chargement du module
+_PREMISE_MARKERS_RE = _compile_terms(['car', 'parce que', 'puisque'])
+_CONCLUSION_MARKERS_RE = _compile_terms(['donc', 'ainsi', 'par conséquent'])
+_EVIDENCE_RE = _compile_terms(['preuve', 'exemple', 'cas', 'étude'])
+_FALLACIES_RE = _compile_terms([
+    'ad hominem', 'homme de paille', "appel à l'autorité",
+    'faux dilemme', 'pente glissante', 'ad populum'
+])
+_AFFIRMATIVE_RE = _compile_terms(['clairement', 'certainement', 'évidemment', 'sans doute', 'absolument'])
+_DUBITATIVE_RE = _compile_terms(['peut-être', 'probablement', 'possiblement', 'il se pourrait', 'on pourrait penser'])
+_COMMON_PHRASES_RE = _compile_terms([
+    "tout le monde sait que",
+    "comme on dit souvent",
+    "il est bien connu que",
+    "évidemment",
+    "bien entendu"
+])
+_UNEXPECTED_RE = _compile_terms([
+    "contrairement à ce qu'on pourrait penser",
+    "sous un angle différent",
+    "perspective alternative",
+    "vision moins connue",
+    "approche inhabituelle"
+])
+_AMBIGUITY_RE = _compile_terms([
+    "peut-être", "possiblement", "il se pourrait", "d'une certaine façon",
+    "en quelque sorte", "plus ou moins", "relativement", "assez"
+])
+_INTRO_RE = _compile_terms(['premièrement', "tout d'abord", 'en premier lieu'])
+_FINAL_RE = _compile_terms(['en conclusion', 'pour conclure', 'ainsi', 'donc'])
+_CONNECTORS_RE = _compile_terms([
+    'car', 'parce que', 'puisque', 'donc', 'ainsi', 'en effet',
+    'cependant', 'toutefois', 'néanmoins', 'malgré', 'bien que',
+    'même si', 'en revanche', 'par ailleurs', 'de plus', 'ensuite'
+])
+
+# Nettoyage et mots vides pour l'extraction de mots-clés
+_KEYWORD_PUNCT_RE = re.compile(r'[^\w\s]')
+_STOP_WORDS = frozenset([
+    "le", "la", "les", "un", "une", "des", "et", "ou", "mais", "car",
+    "donc", "si", "que", "qui", "quoi", "comment", "quand", "où", "est",
+    "sont", "a", "ont", "être", "avoir", "pour", "dans", "par", "sur",
+    "avec", "sans", "ce", "cette", "ces", "mon", "ma", "mes", "ton",
+    "ta", "tes", "son", "sa", "ses", "notre", "nos", "votre", "vos",
+    "leur", "leurs", "de", "du", "au", "aux", "en", "y"
+])
+
+
 class CounterArgumentEvaluator:
     """
     Classe pour évaluer la qualité des contre-arguments.
@@ -58,6 +117,11 @@ class CounterArgumentEvaluator:
             'connects_ideas': lambda text: self._has_connectors(text)
         }
         
+        # Alternations précompilées sur les listes d'instance: chaque critère
+        # se réduit à un balayage unique du texte
+        self._persuasive_re = _compile_terms(self.persuasive_elements)
+        self._logical_re = _compile_terms(self.logical_markers)
+        
         logger.info("CounterArgumentEvaluator initialisé")
     
     def evaluate(
@@ -188,30 +252,18 @@ class CounterArgumentEvaluator:
         base_strength = type_strengths.get(counter_argument.counter_type, 0.5)
         
         # 2. Présence de marqueurs logiques
-        logical_score = 0.0
         content_lower = counter_argument.counter_content.lower()
-        for marker in self.logical_markers:
-            if marker in content_lower:
-                logical_score += 0.1
-                break
+        logical_score = 0.1 if self._logical_re.search(content_lower) else 0.0
         
         # 3. Structure logique (prémisses -> conclusion)
-        has_premise_marker = any(marker in content_lower for marker in ['car', 'parce que', 'puisque'])
-        has_conclusion_marker = any(marker in content_lower for marker in ['donc', 'ainsi', 'par conséquent'])
-        
-        structure_score = 0.1 if has_premise_marker else 0.0
-        structure_score += 0.1 if has_conclusion_marker else 0.0
+        structure_score = 0.1 if _PREMISE_MARKERS_RE.search(content_lower) else 0.0
+        structure_score += 0.1 if _CONCLUSION_MARKERS_RE.search(content_lower) else 0.0
         
         # 4. Présence de preuves ou exemples
-        evidence_score = 0.1 if any(word in content_lower for word in ['preuve', 'exemple', 'cas', 'étude']) else 0.0
+        evidence_score = 0.1 if _EVIDENCE_RE.search(content_lower) else 0.0
         
         # 5. Absence de sophismes communs
-        fallacies = [
-            'ad hominem', 'homme de paille', 'appel à l\'autorité',
-            'faux dilemme', 'pente glissante', 'ad populum'
-        ]
-        
-        fallacy_free = 0.1 if not any(fallacy in content_lower for fallacy in fallacies) else 0.0
+        fallacy_free = 0.1 if not _FALLACIES_RE.search(content_lower) else 0.0
         
         # Combiner les scores
         logical_strength = base_strength + logical_score + structure_score + evidence_score + fallacy_free
@@ -240,8 +292,8 @@ class CounterArgumentEvaluator:
         """
         content_lower = counter_argument.counter_content.lower()
         
-        # 1. Présence d'éléments persuasifs
-        persuasive_count = sum(1 for element in self.persuasive_elements if element in content_lower)
+        # 1. Présence d'éléments persuasifs (éléments distincts trouvés)
+        persuasive_count = len(set(self._persuasive_re.findall(content_lower)))
         persuasive_score = min(persuasive_count * 0.1, 0.5)
         
         # 2. Qualité rhétorique
@@ -260,13 +312,8 @@ class CounterArgumentEvaluator:
                 break
         
         # 3. Ton affirmatif vs dubitatif
-        tone_words = {
-            'affirmatif': ['clairement', 'certainement', 'évidemment', 'sans doute', 'absolument'],
-            'dubitatif': ['peut-être', 'probablement', 'possiblement', 'il se pourrait', 'on pourrait penser']
-        }
-        
-        affirmatif_count = sum(1 for word in tone_words['affirmatif'] if word in content_lower)
-        dubitatif_count = sum(1 for word in tone_words['dubitatif'] if word in content_lower)
+        affirmatif_count = len(set(_AFFIRMATIVE_RE.findall(content_lower)))
+        dubitatif_count = len(set(_DUBITATIVE_RE.findall(content_lower)))
         
         tone_score = 0.1 * (affirmatif_count - dubitatif_count * 0.5)
         tone_score = max(min(tone_score, 0.2), 0.0)  # Limiter entre 0 et 0.2
@@ -296,17 +343,10 @@ class CounterArgumentEvaluator:
             Un score entre 0 et 1
         """
         content = counter_argument.counter_content
+        content_lower = content.lower()
         
         # 1. Présence de formulations communes vs originales
-        common_phrases = [
-            "tout le monde sait que",
-            "comme on dit souvent",
-            "il est bien connu que",
-            "évidemment",
-            "bien entendu"
-        ]
-        
-        common_phrase_count = sum(1 for phrase in common_phrases if phrase in content.lower())
+        common_phrase_count = len(set(_COMMON_PHRASES_RE.findall(content_lower)))
         common_phrase_penalty = min(common_phrase_count * 0.1, 0.3)
         
         # 2. Originalité de la stratégie pour le type d'argument
@@ -317,7 +357,7 @@ class CounterArgumentEvaluator:
             strategy_originality = 0.4  # Combinaison moins commune
         
         # 3. Complexité et richesse du vocabulaire
-        unique_words = set(re.findall(r'\b\w{4,}\b', content.lower()))  # Mots de 4 lettres ou plus
+        unique_words = set(re.findall(r'\b\w{4,}\b', content_lower))  # Mots de 4 lettres ou plus
         word_count = len(content.split())
         
         if word_count > 0:
@@ -327,19 +367,7 @@ class CounterArgumentEvaluator:
             vocabulary_score = 0.0
         
         # 4. Présence de perspectives inattendues
-        unexpected_perspectives = [
-            "contrairement à ce qu'on pourrait penser",
-            "sous un angle différent",
-            "perspective alternative",
-            "vision moins connue",
-            "approche inhabituelle"
-        ]
-        
-        unexpected_score = 0.0
-        for perspective in unexpected_perspectives:
-            if perspective in content.lower():
-                unexpected_score = 0.2
-                break
+        unexpected_score = 0.2 if _UNEXPECTED_RE.search(content_lower) else 0.0
         
         # Combiner les scores
         originality = 0.5 + strategy_originality + vocabulary_score + unexpected_score - common_phrase_penalty
@@ -368,13 +396,8 @@ class CounterArgumentEvaluator:
         # 3. Utilisation de connecteurs logiques
         connectors_score = 0.2 if self._has_connectors(content) else 0.0
         
-        # 4. Absence d'ambiguïtés
-        ambiguity_markers = [
-            "peut-être", "possiblement", "il se pourrait", "d'une certaine façon",
-            "en quelque sorte", "plus ou moins", "relativement", "assez"
-        ]
-        
-        ambiguity_count = sum(1 for marker in ambiguity_markers if marker in content.lower())
+        # 4. Absence d'ambiguïtés (marqueurs distincts trouvés)
+        ambiguity_count = len(set(_AMBIGUITY_RE.findall(content.lower())))
         ambiguity_penalty = min(ambiguity_count * 0.05, 0.2)
         
         # 5. Vocabulaire accessible
@@ -424,13 +447,13 @@ class CounterArgumentEvaluator:
                 recommendations.append("Améliorer la pertinence par rapport à l'argument original")
         
         if logical_strength < threshold:
-            if not any(marker in counter_argument.counter_content.lower() for marker in self.logical_markers):
+            if not self._logical_re.search(counter_argument.counter_content.lower()):
                 recommendations.append("Renforcer la structure logique en utilisant des connecteurs comme 'car', 'donc', 'par conséquent'")
             else:
                 recommendations.append("Renforcer le raisonnement logique du contre-argument")
         
         if persuasiveness < threshold:
-            if not any(element in counter_argument.counter_content.lower() for element in self.persuasive_elements):
+            if not self._persuasive_re.search(counter_argument.counter_content.lower()):
                 recommendations.append("Ajouter des éléments persuasifs comme des exemples concrets ou des preuves")
             else:
                 recommendations.append("Renforcer le pouvoir de persuasion du contre-argument")
@@ -460,23 +483,11 @@ class CounterArgumentEvaluator:
         Returns:
             Ensemble de mots-clés
         """
-        import re
-        
         # Supprimer la ponctuation et convertir en minuscules
-        text = re.sub(r'[^\w\s]', '', text.lower())
-        
-        # Liste de mots vides en français
-        stop_words = [
-            "le", "la", "les", "un", "une", "des", "et", "ou", "mais", "car",
-            "donc", "si", "que", "qui", "quoi", "comment", "quand", "où", "est",
-            "sont", "a", "ont", "être", "avoir", "pour", "dans", "par", "sur",
-            "avec", "sans", "ce", "cette", "ces", "mon", "ma", "mes", "ton",
-            "ta", "tes", "son", "sa", "ses", "notre", "nos", "votre", "vos",
-            "leur", "leurs", "de", "du", "au", "aux", "en", "y"
-        ]
+        text = _KEYWORD_PUNCT_RE.sub('', text.lower())
         
         # Filtrer les mots vides et les mots courts
-        return {word for word in text.split() if word not in stop_words and len(word) > 3}
+        return {word for word in text.split() if word not in _STOP_WORDS and len(word) > 3}
     
     def _average_sentence_length(self, text: str) -> float:
         """
@@ -508,13 +519,9 @@ class CounterArgumentEvaluator:
             True si le texte a une structure claire, False sinon
         """
         # Vérifier la présence d'éléments structurants
-        intro_markers = ['premièrement', 'tout d\'abord', 'en premier lieu']
-        development_markers = ['ensuite', 'de plus', 'par ailleurs', 'en outre']
-        conclusion_markers = ['en conclusion', 'pour conclure', 'ainsi', 'donc']
-        
-        has_intro = any(marker in text.lower() for marker in intro_markers)
-        has_development = any(marker in text.lower() for marker in development_markers)
-        has_conclusion = any(marker in text.lower() for marker in conclusion_markers)
+        text_lower = text.lower()
+        has_intro = _INTRO_RE.search(text_lower) is not None
+        has_conclusion = _FINAL_RE.search(text_lower) is not None
         
         # Structure minimale : introduction et conclusion
         return has_intro or has_conclusion
@@ -529,13 +536,7 @@ class CounterArgumentEvaluator:
         Returns:
             True si le texte utilise des connecteurs, False sinon
         """
-        connectors = [
-            'car', 'parce que', 'puisque', 'donc', 'ainsi', 'en effet',
-            'cependant', 'toutefois', 'néanmoins', 'malgré', 'bien que',
-            'même si', 'en revanche', 'par ailleurs', 'de plus', 'ensuite'
-        ]
-        
-        return any(connector in text.lower() for connector in connectors)
+        return _CONNECTORS_RE.search(text.lower()) is not None
     
     def _assess_vocabulary_complexity(self, text: str) -> float:
         """
@@ -274,52 +274,57 @@ class MetricsTracker:
             metrics: L'instance de PerformanceMetrics à utiliser
         """
         self.metrics = metrics
-        self.start_time = None
-        self.current_counter_type = None
-        
+
         logger.debug("MetricsTracker initialisé")
-    
-    def start_tracking(self, counter_type: CounterArgumentType) -> None:
+
+    def start_tracking(self, counter_type: CounterArgumentType) -> Tuple[CounterArgumentType, float]:
         """
         Commence à suivre le temps pour un type de contre-argument.
-        
+
         Args:
             counter_type: Le type de contre-argument
+
+        Returns:
+            Un jeton à repasser à stop_tracking. L'état du suivi vit dans
+            le jeton et non dans le tracker: des générations concurrentes
+            sur le même agent ne peuvent donc ni écraser le suivi l'une de
+            l'autre, ni se voir attribuer la durée ou le type d'une autre.
         """
-        self.start_time = time.time()
-        self.current_counter_type = counter_type
-        
         logger.debug(f"Début du suivi pour {counter_type.value}")
-    
-    def stop_tracking(self, evaluation_result: EvaluationResult, success: bool = True) -> float:
+        return (counter_type, time.time())
+
+    def stop_tracking(
+        self,
+        token: Optional[Tuple[CounterArgumentType, float]],
+        evaluation_result: EvaluationResult,
+        success: bool = True
+    ) -> float:
         """
         Arrête le suivi et enregistre les métriques.
-        
+
         Args:
+            token: Le jeton retourné par start_tracking
             evaluation_result: Le résultat de l'évaluation
             success: Si la génération a réussi
-            
+
         Returns:
             Le temps d'exécution en secondes
         """
-        if self.start_time is None or self.current_counter_type is None:
+        if token is None:
             logger.warning("Tentative d'arrêt du suivi sans démarrage préalable")
             return 0.0
-        
-        execution_time = time.time() - self.start_time
-        
+
+        counter_type, start_time = token
+        execution_time = time.time() - start_time
+
         # Enregistrer les métriques
         self.metrics.record_metrics(
             evaluation_result,
-            self.current_counter_type,
+            counter_type,
             execution_time,
             success
         )
-        
-        logger.debug(f"Fin du suivi pour {self.current_counter_type.value}, temps: {execution_time:.3f}s")
-        
-        # Réinitialiser
-        self.start_time = None
-        self.current_counter_type = None
-        
+
+        logger.debug(f"Fin du suivi pour {counter_type.value}, temps: {execution_time:.3f}s")
+
         return execution_time 
\ No newline at end of file
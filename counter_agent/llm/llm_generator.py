@@ -6,16 +6,137 @@ de langage (LLMs) via des API comme OpenAI.
 """
 
 import os
+import copy
 import json
+import time
+import sqlite3
+import hashlib
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional
+import functools
+import threading
+from typing import Dict, Iterator, List, Any, Optional, Union
 
+import httpx
 import openai
-from openai import OpenAI, AsyncOpenAI
+from openai import (
+    OpenAI,
+    AsyncOpenAI,
+    RateLimitError,
+    APITimeoutError,
+    APIConnectionError,
+)
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+# tiktoken permet de compter les tokens avant envoi et donc de tronquer les
+# textes trop longs localement, au lieu de payer un aller-retour réseau pour
+# se voir refuser la requête (400 contexte dépassé) par l'API.
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# Utiliser orjson (parseur C, 2-3x plus rapide que le module json standard)
+# pour décoder les réponses JSON du LLM; orjson.JSONDecodeError est une
+# sous-classe de json.JSONDecodeError, les except existants restent valables.
+try:
+    import orjson as _fast_json
+except ImportError:
+    _fast_json = None
+
+
+def _json_loads(content: str) -> Any:
+    """Décode une réponse JSON du LLM avec orjson si disponible."""
+    if _fast_json is not None:
+        return _fast_json.loads(content)
+    return json.loads(content)
+
+
+# Schémas msgspec pour valider les réponses du LLM en une passe C: le décodage
+# typé (avec valeurs par défaut pour les champs omis) remplace la construction
+# de dicts puis les vérifications dispersées chez les appelants. L'API dict est
+# conservée via msgspec.to_builtins; en l'absence de msgspec on retombe sur le
+# décodage JSON brut. Les erreurs de décodage comme de validation dérivent de
+# ValueError dans les deux chemins.
+try:
+    import msgspec
+
+    class _AnalysisSchema(msgspec.Struct):
+        premises: List[str] = []
+        conclusion: str = ""
+        argument_type: str = "unknown"
+        explanation: str = ""
+
+    class _VulnerabilitySchema(msgspec.Struct):
+        type: str = "inconnu"
+        target: str = "inconnu"
+        description: str = ""
+        score: float = 0.5
+        suggested_counter_type: str = "direct_refutation"
+
+    class _VulnerabilityListSchema(msgspec.Struct):
+        vulnerabilities: List[_VulnerabilitySchema] = []
+
+    class _CounterArgumentSchema(msgspec.Struct):
+        counter_argument: str
+        target_component: str = "unknown"
+        strength: str = "moderate"
+        confidence: float = 0.8
+        supporting_evidence: List[str] = []
+        rhetorical_strategy: str = ""
+        explanation: str = ""
+
+    class _EvaluationScoresSchema(msgspec.Struct):
+        relevance: float = 0.5
+        logical_strength: float = 0.5
+        persuasiveness: float = 0.5
+        originality: float = 0.5
+        clarity: float = 0.5
+
+    class _EvaluationSchema(msgspec.Struct):
+        scores: _EvaluationScoresSchema = msgspec.field(
+            default_factory=_EvaluationScoresSchema
+        )
+        overall_score: float = 0.5
+        recommendations: List[str] = []
+        explanation: str = ""
+
+    _ANALYSIS_DECODER = msgspec.json.Decoder(_AnalysisSchema)
+    _VULN_DECODER = msgspec.json.Decoder(_VulnerabilityListSchema)
+    _COUNTER_DECODER = msgspec.json.Decoder(_CounterArgumentSchema)
+    _EVAL_DECODER = msgspec.json.Decoder(_EvaluationSchema)
+
+    def _decode_analysis(content: str) -> Dict[str, Any]:
+        return msgspec.to_builtins(_ANALYSIS_DECODER.decode(content))
+
+    def _decode_vulnerabilities(content: str) -> List[Dict[str, Any]]:
+        return msgspec.to_builtins(_VULN_DECODER.decode(content).vulnerabilities)
+
+    def _decode_counter_argument(content: str) -> Dict[str, Any]:
+        return msgspec.to_builtins(_COUNTER_DECODER.decode(content))
+
+    def _decode_evaluation(content: str) -> Dict[str, Any]:
+        return msgspec.to_builtins(_EVAL_DECODER.decode(content))
+
+except ImportError:
+    msgspec = None
 
-# Ajouter dotenv pour charger les variables d'environnement depuis .env
-from dotenv import load_dotenv
+    def _decode_analysis(content: str) -> Dict[str, Any]:
+        return _json_loads(content)
+
+    def _decode_vulnerabilities(content: str) -> List[Dict[str, Any]]:
+        return _json_loads(content).get("vulnerabilities", [])
+
+    def _decode_counter_argument(content: str) -> Dict[str, Any]:
+        return _json_loads(content)
+
+    def _decode_evaluation(content: str) -> Dict[str, Any]:
+        return _json_loads(content)
 
 from ..agent.definitions import (
     Argument, 
@@ -28,39 +149,321 @@ from ..agent.definitions import (
 from .prompts import (
     ARGUMENT_ANALYSIS_PROMPT,
     VULNERABILITY_IDENTIFICATION_PROMPT,
-    COUNTER_ARGUMENT_GENERATION_PROMPT,
+    COUNTER_ARGUMENT_GENERATION_SKELETON,
+    COUNTER_ARGUMENT_GENERATION_DATA,
     COUNTER_ARGUMENT_EVALUATION_PROMPT,
     format_prompt
 )
 
 logger = logging.getLogger(__name__)
 
-# Charger les variables d'environnement
-load_dotenv()
+def _maybe_load_dotenv():
+    """Charge .env seulement si la clé API manque (import paresseux de dotenv)."""
+    # En production (conteneur, systemd) les variables sont déjà posées:
+    # inutile de payer l'import de dotenv et la lecture du fichier. dotenv
+    # devient du même coup une dépendance optionnelle.
+    if 'OPENAI_API_KEY' in os.environ:
+        return
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+    load_dotenv()
+
+
+# Charger les variables d'environnement au besoin
+_maybe_load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
+# Taille maximale des caches de réponses LLM (éviction du plus ancien)
+_CACHE_MAX_ENTRIES = 512
+
+# Durée de vie des entrées du cache persistant SQLite (les appels sont
+# déterministes à temperature=0.3, mais les modèles servis évoluent)
+_DB_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+# Budgets de tokens par champ de prompt: bornes prudentes qui laissent, même
+# cumulées avec le template et max_tokens, une marge confortable sous la
+# fenêtre de contexte des modèles utilisés.
+_ARGUMENT_TOKEN_BUDGET = 1500
+_VULNS_TOKEN_BUDGET = 600
+
+# Messages système constants, alloués une fois au chargement du module: chaque
+# appel réutilise le même dict au lieu d'en reconstruire un identique. Ne pas
+# les muter — ils sont partagés entre tous les appels.
+_SYS_ANALYZE = {
+    "role": "system",
+    "content": "Vous êtes un expert en analyse d'arguments. Votre tâche est d'analyser la structure d'un argument."
+}
+_SYS_VULNERABILITIES = {
+    "role": "system",
+    "content": "Vous êtes un expert en analyse d'arguments. Votre tâche est d'identifier les vulnérabilités dans un argument."
+}
+_SYS_GENERATE = {
+    "role": "system",
+    "content": "Vous êtes un expert en argumentation. Votre tâche est de générer un contre-argument pertinent."
+}
+_SYS_EVALUATE = {
+    "role": "system",
+    "content": "Vous êtes un expert en évaluation d'arguments. Votre tâche est d'évaluer la qualité d'un contre-argument."
+}
+
+# Politique de relance commune aux appels LLM: backoff exponentiel jitterisé,
+# limité aux erreurs transitoires (429, timeouts, resets de connexion). Les
+# erreurs non transitoires (clé invalide, requête malformée) remontent
+# immédiatement vers les fallbacks des appelants sans gaspiller de tentatives.
+_llm_retry = retry(
+    retry=retry_if_exception_type(
+        (RateLimitError, APITimeoutError, APIConnectionError)
+    ),
+    stop=stop_after_attempt(3),
+    wait=wait_random_exponential(multiplier=0.5, max=10),
+    reraise=True,
+)
+
+
+def _cache_key(*parts: str) -> str:
+    """Calcule une clé de cache compacte à partir de fragments de texte."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
 class LLMGenerator:
     """
     Classe pour générer des contre-arguments en utilisant des LLMs.
+
+    Chaque instance porte ses propres clients OpenAI et son pool de connexions
+    HTTP: instancier la classe à chaque requête repaye les handshakes TLS et
+    vide les caches. Préférer l'instance partagée de ``LLMGenerator.default()``
+    sauf besoin d'une configuration spécifique (autre clé, autre modèle).
     """
+
+    _default_instance: Optional["LLMGenerator"] = None
+    _default_lock = threading.Lock()
+
+    @classmethod
+    def default(cls) -> "LLMGenerator":
+        """
+        Retourne l'instance partagée du générateur (créée au premier appel).
+
+        Returns:
+            L'instance LLMGenerator unique du processus
+        """
+        if cls._default_instance is None:
+            with cls._default_lock:
+                if cls._default_instance is None:
+                    cls._default_instance = cls()
+        return cls._default_instance
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-3.5-turbo"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "gpt-3.5-turbo",
+        cache_path: Optional[str] = "llm_cache.sqlite"
+    ):
         """
         Initialise le générateur LLM.
         
         Args:
             api_key: Clé API pour le service LLM (OpenAI par défaut)
             model: Modèle LLM à utiliser
+            cache_path: Fichier SQLite du cache persistant (None pour désactiver)
         """
         self.api_key = api_key or OPENAI_API_KEY
         self.model = model
-        
-        # Initialiser le client OpenAI
+
+        # Client HTTP partagé avec pool de connexions persistantes et HTTP/2:
+        # le multiplexage évite la sérialisation des requêtes concurrentes et
+        # le keep-alive amortit le coût des handshakes TLS entre les appels.
+        self._http = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=httpx.Timeout(connect=5.0, read=60.0, write=10.0, pool=5.0)
+        )
+
+        # Initialiser le client OpenAI avec un timeout explicite: un appel
+        # suspendu ne doit pas bloquer indéfiniment tout un lot de générations.
+        # max_retries=0 car la politique de relance est portée par tenacity
+        # (voir _llm_retry), pour ne pas multiplier les tentatives (3x3).
         openai.api_key = self.api_key
-        self.client = OpenAI(api_key=self.api_key)
-        self.async_client = AsyncOpenAI(api_key=self.api_key)
-        
-        logger.info(f"LLMGenerator initialisé avec le modèle {self.model}")
+        self.client = OpenAI(api_key=self.api_key, timeout=30.0, max_retries=0)
+        self.async_client = AsyncOpenAI(
+            api_key=self.api_key, http_client=self._http, max_retries=0
+        )
+
+        # Caches en mémoire pour les appels déterministes (temperature=0.3):
+        # le même argument est analysé plusieurs fois dans le pipeline
+        # (analyse → vulnérabilités → génération → évaluation).
+        self._analyze_cache: Dict[str, Dict[str, Any]] = {}
+        self._vuln_cache: Dict[str, List[Dict[str, Any]]] = {}
+        self._eval_cache: Dict[str, Dict[str, Any]] = {}
+
+        # Encodeur de tokens du modèle pour borner la taille des prompts.
+        # Chargement tolérant: sans encodeur, les textes partent non tronqués.
+        self._enc = None
+        if tiktoken is not None:
+            try:
+                self._enc = tiktoken.encoding_for_model(model)
+            except KeyError:
+                self._enc = tiktoken.get_encoding("cl100k_base")
+
+        # Générations identiques en vol: sous charge concurrente, N coroutines
+        # demandant le même contre-argument attendent le Future de la première
+        # au lieu de déclencher N allers-retours réseau.
+        self._inflight: Dict[str, "asyncio.Future"] = {}
+
+        # Boucle asyncio d'arrière-plan pour les appels synchrones: une seule
+        # boucle pérenne héberge le client HTTP partagé et les Futures de
+        # dédoublonnage. Un asyncio.run par appel détruirait la boucle à
+        # chaque retour, orphelinant les connexions keep-alive du client
+        # ("Event loop is closed") et liant les Futures en vol à des boucles
+        # mortes lorsque plusieurs threads appellent en parallèle.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+
+        # Étage persistant du cache: une table SQLite en mode WAL partagée
+        # entre processus, pour que relances et boucles de développement
+        # relisent les réponses déjà payées au lieu de rappeler l'API.
+        # Tolérant aux pannes: sans base, seul l'étage mémoire subsiste.
+        self._db = None
+        self._db_lock = threading.Lock()
+        if cache_path:
+            try:
+                self._db = sqlite3.connect(cache_path, check_same_thread=False)
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS cache ("
+                    "key BLOB PRIMARY KEY, value BLOB, created REAL)"
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning("Cache SQLite indisponible (%s): %s", cache_path, e)
+                self._db = None
+
+        logger.info("LLMGenerator initialisé avec le modèle %s", self.model)
+
+    def _db_key(self, namespace: str, key: str) -> bytes:
+        """Clé du cache persistant: espace de noms + modèle + clé mémoire."""
+        return f"{namespace}:{self.model}:{key}".encode("utf-8")
+
+    def _db_get(self, namespace: str, key: str) -> Optional[Any]:
+        """Lit une entrée du cache SQLite, en purgeant les entrées expirées."""
+        if self._db is None:
+            return None
+        db_key = self._db_key(namespace, key)
+        try:
+            with self._db_lock:
+                row = self._db.execute(
+                    "SELECT value, created FROM cache WHERE key = ?", (db_key,)
+                ).fetchone()
+            if row is None:
+                return None
+            value, created = row
+            if time.time() - created > _DB_CACHE_TTL_SECONDS:
+                with self._db_lock:
+                    self._db.execute("DELETE FROM cache WHERE key = ?", (db_key,))
+                    self._db.commit()
+                return None
+            return _json_loads(value)
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning("Lecture du cache SQLite impossible: %s", e)
+            return None
+
+    def _db_put(self, namespace: str, key: str, value: Any) -> None:
+        """Écrit une entrée dans le cache SQLite (silencieux en cas d'échec)."""
+        if self._db is None:
+            return
+        if _fast_json is not None:
+            payload = _fast_json.dumps(value)
+        else:
+            payload = json.dumps(value).encode("utf-8")
+        try:
+            with self._db_lock:
+                self._db.execute(
+                    "INSERT OR IGNORE INTO cache (key, value, created) "
+                    "VALUES (?, ?, ?)",
+                    (self._db_key(namespace, key), payload, time.time())
+                )
+                self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning("Écriture du cache SQLite impossible: %s", e)
+
+    def _cache_get(self, cache: Dict[str, Any], key: str, namespace: str) -> Optional[Any]:
+        """Retourne une copie de l'entrée de cache (mémoire puis disque), ou None."""
+        value = cache.get(key)
+        if value is not None:
+            logger.debug("Cache LLM: hit pour la clé %s", key)
+            return copy.deepcopy(value)
+        value = self._db_get(namespace, key)
+        if value is None:
+            return None
+        # Promouvoir l'entrée disque dans l'étage mémoire
+        logger.debug("Cache LLM: hit disque pour %s/%s", namespace, key)
+        if len(cache) >= _CACHE_MAX_ENTRIES:
+            cache.pop(next(iter(cache)))
+        cache[key] = copy.deepcopy(value)
+        return value
+
+    def _cache_put(self, cache: Dict[str, Any], key: str, value: Any, namespace: str) -> None:
+        """Insère une entrée dans les deux étages du cache."""
+        if len(cache) >= _CACHE_MAX_ENTRIES:
+            cache.pop(next(iter(cache)))
+        cache[key] = copy.deepcopy(value)
+        self._db_put(namespace, key, value)
+
+    def _ensure_background_loop(self) -> asyncio.AbstractEventLoop:
+        """Retourne la boucle d'arrière-plan, en la démarrant au besoin."""
+        # Double vérification sous verrou: la boucle et son thread démon ne
+        # sont créés qu'une fois, au premier appel synchrone.
+        if self._loop is None:
+            with self._loop_lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    threading.Thread(
+                        target=loop.run_forever,
+                        name="llm-generator-loop",
+                        daemon=True
+                    ).start()
+                    self._loop = loop
+        return self._loop
+
+    async def close(self):
+        """Ferme le client HTTP partagé et la connexion au cache SQLite."""
+        await self._http.aclose()
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+        with self._loop_lock:
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._loop = None
+        logger.debug("Client HTTP du LLMGenerator fermé")
+
+    def _truncate_to(self, text: str, budget: int) -> str:
+        """Tronque un texte au budget de tokens donné (inchangé s'il tient déjà)."""
+        if self._enc is None:
+            return text
+        tokens = self._enc.encode(text)
+        if len(tokens) <= budget:
+            return text
+        logger.warning(
+            "Texte tronqué de %d à %d tokens avant envoi au LLM", len(tokens), budget
+        )
+        return self._enc.decode(tokens[:budget])
+
+    @_llm_retry
+    def _create_completion(self, **kwargs) -> Any:
+        """Appel bas niveau à l'API, relancé sur les erreurs transitoires."""
+        return self.client.chat.completions.create(model=self.model, **kwargs)
+
+    @_llm_retry
+    async def _acreate_completion(self, **kwargs) -> Any:
+        """Variante asynchrone de _create_completion, même politique de relance."""
+        return await self.async_client.chat.completions.create(
+            model=self.model, **kwargs
+        )
     
     def analyze_argument(self, argument_text: str) -> Dict[str, Any]:
         """
@@ -72,27 +475,44 @@ class LLMGenerator:
         Returns:
             Un dictionnaire contenant l'analyse de l'argument
         """
+        argument_text = self._truncate_to(argument_text, _ARGUMENT_TOKEN_BUDGET)
+        key = _cache_key(argument_text)
+        cached = self._cache_get(self._analyze_cache, key, "analyze")
+        if cached is not None:
+            return cached
+
         prompt = format_prompt(ARGUMENT_ANALYSIS_PROMPT, argument_text=argument_text)
-        
+
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
+            response = self._create_completion(
                 messages=[
-                    {"role": "system", "content": "Vous êtes un expert en analyse d'arguments. Votre tâche est d'analyser la structure d'un argument."},
+                    _SYS_ANALYZE,
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.3,
-                max_tokens=500
+                max_tokens=500,
+                response_format={"type": "json_object"}
             )
-            
+
             content = response.choices[0].message.content
-            logger.debug(f"Réponse LLM pour l'analyse d'argument: {content[:100]}...")
-            
-            # Parser la réponse
-            return self._parse_argument_analysis(content)
-            
+            logger.debug("Réponse LLM pour l'analyse d'argument: %.100s...", content)
+
+            # Décoder et valider la réponse JSON, puis mettre en cache
+            try:
+                result = _decode_analysis(content)
+            except ValueError:
+                logger.error("Erreur de décodage JSON: %s", content)
+                return {
+                    "premises": [],
+                    "conclusion": "",
+                    "argument_type": "unknown",
+                    "explanation": "Erreur de format dans la réponse du LLM."
+                }
+            self._cache_put(self._analyze_cache, key, result, "analyze")
+            return result
+
         except Exception as e:
-            logger.error(f"Erreur lors de l'analyse d'argument avec LLM: {e}")
+            logger.error("Erreur lors de l'analyse d'argument avec LLM: %s", e)
             return {
                 "premises": [],
                 "conclusion": "",
@@ -110,20 +530,23 @@ class LLMGenerator:
         Returns:
             Une liste de vulnérabilités identifiées
         """
-        premises_str = "\n".join([f"- {p}" for p in argument.premises])
+        key = _cache_key(argument.content, argument.argument_type)
+        cached = self._cache_get(self._vuln_cache, key, "vulns")
+        if cached is not None:
+            return cached
+
         prompt = format_prompt(
             VULNERABILITY_IDENTIFICATION_PROMPT,
-            argument_text=argument.content,
-            premises=premises_str,
+            argument_text=self._truncate_to(argument.content, _ARGUMENT_TOKEN_BUDGET),
+            premises=argument.premises_str,
             conclusion=argument.conclusion,
             argument_type=argument.argument_type
         )
         
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
+            response = self._create_completion(
                 messages=[
-                    {"role": "system", "content": "Vous êtes un expert en analyse d'arguments. Votre tâche est d'identifier les vulnérabilités dans un argument."},
+                    _SYS_VULNERABILITIES,
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.3,
@@ -132,20 +555,78 @@ class LLMGenerator:
             )
             
             content = response.choices[0].message.content
-            logger.debug(f"Réponse LLM pour l'identification des vulnérabilités: {content[:100]}...")
+            logger.debug("Réponse LLM pour l'identification des vulnérabilités: %.100s...", content)
             
-            # Parser la réponse JSON
+            # Décoder et valider la réponse JSON
             try:
-                data = json.loads(content)
-                return data.get("vulnerabilities", [])
-            except json.JSONDecodeError:
-                logger.error(f"Erreur de décodage JSON: {content}")
+                vulnerabilities = _decode_vulnerabilities(content)
+                self._cache_put(self._vuln_cache, key, vulnerabilities, "vulns")
+                return vulnerabilities
+            except ValueError:
+                logger.error("Erreur de décodage JSON: %s", content)
                 return []
             
         except Exception as e:
-            logger.error(f"Erreur lors de l'identification des vulnérabilités avec LLM: {e}")
+            logger.error("Erreur lors de l'identification des vulnérabilités avec LLM: %s", e)
             return []
     
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _render_generation_skeleton(counter_type_value: str, strategy_value: str) -> str:
+        """
+        Rend le squelette du prompt de génération (mémorisé par couple).
+
+        Le squelette ne dépend que du type de contre-argument et de la
+        stratégie: 25 couples possibles au plus, rendus chacun une fois.
+        """
+        return format_prompt(
+            COUNTER_ARGUMENT_GENERATION_SKELETON,
+            counter_type=counter_type_value,
+            rhetorical_strategy=strategy_value
+        )
+
+    def _build_generation_messages(
+        self,
+        argument: Argument,
+        counter_type: CounterArgumentType,
+        vulnerabilities: List[Vulnerability] = None,
+        rhetorical_strategy: RhetoricalStrategy = None
+    ) -> List[Dict[str, str]]:
+        """
+        Construit la liste de messages pour la génération d'un contre-argument.
+
+        Partagé entre les chemins synchrone et asynchrone pour éviter la
+        duplication de la construction du prompt. Le message utilisateur
+        s'ouvre par le squelette stable (instructions + schéma JSON) et se
+        termine par le contenu propre à l'argument: les requêtes partageant
+        le couple (type, stratégie) présentent ainsi un préfixe identique,
+        exploitable par le cache de prompt du fournisseur.
+        """
+        # Formater les vulnérabilités (formats mémorisés sur les objets)
+        if vulnerabilities:
+            vulns_str = "\n".join(v.formatted for v in vulnerabilities)
+            vulns_str = self._truncate_to(vulns_str, _VULNS_TOKEN_BUDGET)
+        else:
+            vulns_str = "Aucune vulnérabilité spécifique identifiée."
+
+        # Préparer la stratégie rhétorique
+        strat_str = rhetorical_strategy.value if rhetorical_strategy else "au choix"
+
+        skeleton = self._render_generation_skeleton(counter_type.value, strat_str)
+        data = format_prompt(
+            COUNTER_ARGUMENT_GENERATION_DATA,
+            argument_text=self._truncate_to(argument.content, _ARGUMENT_TOKEN_BUDGET),
+            premises=argument.premises_str,
+            conclusion=argument.conclusion,
+            argument_type=argument.argument_type,
+            vulnerabilities=vulns_str
+        )
+
+        return [
+            _SYS_GENERATE,
+            {"role": "user", "content": skeleton + data}
+        ]
+
     def generate_counter_argument(
         self,
         argument: Argument,
@@ -155,63 +636,91 @@ class LLMGenerator:
     ) -> Dict[str, Any]:
         """
         Génère un contre-argument en utilisant un LLM.
-        
+
+        Version synchrone: soumet le chemin asynchrone à la boucle
+        d'arrière-plan partagée afin de n'entretenir qu'une seule
+        implémentation de la génération. Tous les appels synchrones, quel
+        que soit leur thread, convergent ainsi vers la boucle qui héberge
+        le client HTTP et les Futures de dédoublonnage.
+
         Args:
             argument: L'argument original
             counter_type: Le type de contre-argument à générer
             vulnerabilities: Liste des vulnérabilités identifiées (optionnel)
             rhetorical_strategy: Stratégie rhétorique à utiliser (optionnel)
-            
+
         Returns:
             Un dictionnaire contenant le contre-argument généré
         """
-        premises_str = "\n".join([f"- {p}" for p in argument.premises])
-        
-        # Formater les vulnérabilités
-        if vulnerabilities:
-            vulns_str = "\n".join([
-                f"- Type: {v.type}, Cible: {v.target}, Score: {v.score:.2f}, "
-                f"Description: {v.description}"
-                for v in vulnerabilities
-            ])
-        else:
-            vulns_str = "Aucune vulnérabilité spécifique identifiée."
-        
-        # Préparer la stratégie rhétorique
-        strat_str = rhetorical_strategy.value if rhetorical_strategy else "au choix"
-        
-        prompt = format_prompt(
-            COUNTER_ARGUMENT_GENERATION_PROMPT,
-            argument_text=argument.content,
-            premises=premises_str,
-            conclusion=argument.conclusion,
-            argument_type=argument.argument_type,
-            vulnerabilities=vulns_str,
-            counter_type=counter_type.value,
-            rhetorical_strategy=strat_str
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # Pas de boucle en cours dans ce thread: soumettre le chemin
+            # asynchrone à la boucle d'arrière-plan et bloquer sur le résultat
+            return asyncio.run_coroutine_threadsafe(
+                self.generate_counter_argument_async(
+                    argument, counter_type, vulnerabilities, rhetorical_strategy
+                ),
+                self._ensure_background_loop()
+            ).result()
+
+        raise RuntimeError(
+            "generate_counter_argument appelé depuis une boucle asyncio; "
+            "utiliser generate_counter_argument_async à la place."
         )
-        
+
+    def generate_counter_argument_stream(
+        self,
+        argument: Argument,
+        counter_type: CounterArgumentType,
+        vulnerabilities: List[Vulnerability] = None,
+        rhetorical_strategy: RhetoricalStrategy = None
+    ) -> Iterator[Union[str, Dict[str, Any]]]:
+        """
+        Génère un contre-argument en diffusant les fragments au fil de l'eau.
+
+        Générateur synchrone destiné aux réponses HTTP en flux: chaque
+        élément produit est un fragment de texte (str) de la réponse en
+        cours de génération; le DERNIER élément est le dictionnaire décodé,
+        au même format que generate_counter_argument. Pas de cache ni de
+        dédoublonnage sur ce chemin: la diffusion n'a de sens que pour une
+        génération effectivement en cours.
+
+        Args:
+            argument: L'argument original
+            counter_type: Le type de contre-argument à générer
+            vulnerabilities: Liste des vulnérabilités identifiées (optionnel)
+            rhetorical_strategy: Stratégie rhétorique à utiliser (optionnel)
+        """
+        messages = self._build_generation_messages(
+            argument, counter_type, vulnerabilities, rhetorical_strategy
+        )
+
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "Vous êtes un expert en argumentation. Votre tâche est de générer un contre-argument pertinent."},
-                    {"role": "user", "content": prompt}
-                ],
+            stream = self._create_completion(
+                messages=messages,
                 temperature=0.7,
                 max_tokens=1000,
-                response_format={"type": "json_object"}
+                response_format={"type": "json_object"},
+                stream=True,
+                timeout=60.0
             )
-            
-            content = response.choices[0].message.content
-            logger.debug(f"Réponse LLM pour la génération de contre-argument: {content[:100]}...")
-            
-            # Parser la réponse JSON
+
+            buf = []
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    delta = chunk.choices[0].delta.content
+                    buf.append(delta)
+                    yield delta
+            content = ''.join(buf)
+            logger.debug("Réponse LLM pour la génération de contre-argument (flux): %.100s...", content)
+
+            # Décoder et valider la réponse JSON
             try:
-                return json.loads(content)
-            except json.JSONDecodeError:
-                logger.error(f"Erreur de décodage JSON: {content}")
-                return {
+                yield _decode_counter_argument(content)
+            except ValueError:
+                logger.error("Erreur de décodage JSON (flux): %s", content)
+                yield {
                     "counter_argument": "Erreur lors de la génération du contre-argument.",
                     "target_component": "unknown",
                     "strength": "weak",
@@ -219,10 +728,10 @@ class LLMGenerator:
                     "supporting_evidence": [],
                     "explanation": "Erreur de format dans la réponse du LLM."
                 }
-            
+
         except Exception as e:
-            logger.error(f"Erreur lors de la génération de contre-argument avec LLM: {e}")
-            return {
+            logger.error("Erreur lors de la génération de contre-argument avec LLM (flux): %s", e)
+            yield {
                 "counter_argument": f"Erreur lors de la génération: {str(e)}",
                 "target_component": "error",
                 "strength": "weak",
@@ -230,7 +739,7 @@ class LLMGenerator:
                 "supporting_evidence": [],
                 "explanation": f"Exception: {str(e)}"
             }
-    
+
     def evaluate_counter_argument(
         self,
         original_argument: Argument,
@@ -246,6 +755,15 @@ class LLMGenerator:
         Returns:
             Un dictionnaire contenant l'évaluation du contre-argument
         """
+        key = _cache_key(
+            original_argument.content,
+            counter_argument.counter_content,
+            counter_argument.counter_type.value
+        )
+        cached = self._cache_get(self._eval_cache, key, "eval")
+        if cached is not None:
+            return cached
+
         prompt = format_prompt(
             COUNTER_ARGUMENT_EVALUATION_PROMPT,
             original_argument=original_argument.content,
@@ -255,25 +773,32 @@ class LLMGenerator:
         )
         
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
+            # Streaming: accumuler les tokens au fil de la réception réseau
+            stream = self._create_completion(
                 messages=[
-                    {"role": "system", "content": "Vous êtes un expert en évaluation d'arguments. Votre tâche est d'évaluer la qualité d'un contre-argument."},
+                    _SYS_EVALUATE,
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.3,
                 max_tokens=800,
-                response_format={"type": "json_object"}
+                response_format={"type": "json_object"},
+                stream=True
             )
-            
-            content = response.choices[0].message.content
-            logger.debug(f"Réponse LLM pour l'évaluation de contre-argument: {content[:100]}...")
-            
-            # Parser la réponse JSON
+
+            buf = []
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    buf.append(chunk.choices[0].delta.content)
+            content = ''.join(buf)
+            logger.debug("Réponse LLM pour l'évaluation de contre-argument: %.100s...", content)
+
+            # Décoder et valider la réponse JSON
             try:
-                return json.loads(content)
-            except json.JSONDecodeError:
-                logger.error(f"Erreur de décodage JSON: {content}")
+                result = _decode_evaluation(content)
+                self._cache_put(self._eval_cache, key, result, "eval")
+                return result
+            except ValueError:
+                logger.error("Erreur de décodage JSON: %s", content)
                 return {
                     "scores": {
                         "relevance": 0.5,
@@ -288,7 +813,7 @@ class LLMGenerator:
                 }
             
         except Exception as e:
-            logger.error(f"Erreur lors de l'évaluation de contre-argument avec LLM: {e}")
+            logger.error("Erreur lors de l'évaluation de contre-argument avec LLM: %s", e)
             return {
                 "scores": {
                     "relevance": 0.3,
@@ -312,27 +837,44 @@ class LLMGenerator:
         Returns:
             Un dictionnaire contenant l'analyse de l'argument
         """
+        argument_text = self._truncate_to(argument_text, _ARGUMENT_TOKEN_BUDGET)
+        key = _cache_key(argument_text)
+        cached = self._cache_get(self._analyze_cache, key, "analyze")
+        if cached is not None:
+            return cached
+
         prompt = format_prompt(ARGUMENT_ANALYSIS_PROMPT, argument_text=argument_text)
-        
+
         try:
-            response = await self.async_client.chat.completions.create(
-                model=self.model,
+            response = await self._acreate_completion(
                 messages=[
-                    {"role": "system", "content": "Vous êtes un expert en analyse d'arguments. Votre tâche est d'analyser la structure d'un argument."},
+                    _SYS_ANALYZE,
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.3,
-                max_tokens=500
+                max_tokens=500,
+                response_format={"type": "json_object"}
             )
-            
+
             content = response.choices[0].message.content
-            logger.debug(f"Réponse LLM pour l'analyse d'argument (async): {content[:100]}...")
-            
-            # Parser la réponse
-            return self._parse_argument_analysis(content)
+            logger.debug("Réponse LLM pour l'analyse d'argument (async): %.100s...", content)
+
+            # Décoder et valider la réponse JSON, puis mettre en cache
+            try:
+                result = _decode_analysis(content)
+            except ValueError:
+                logger.error("Erreur de décodage JSON (async): %s", content)
+                return {
+                    "premises": [],
+                    "conclusion": "",
+                    "argument_type": "unknown",
+                    "explanation": "Erreur de format dans la réponse du LLM."
+                }
+            self._cache_put(self._analyze_cache, key, result, "analyze")
+            return result
             
         except Exception as e:
-            logger.error(f"Erreur lors de l'analyse d'argument avec LLM (async): {e}")
+            logger.error("Erreur lors de l'analyse d'argument avec LLM (async): %s", e)
             return {
                 "premises": [],
                 "conclusion": "",
@@ -359,52 +901,69 @@ class LLMGenerator:
         Returns:
             Un dictionnaire contenant le contre-argument généré
         """
-        premises_str = "\n".join([f"- {p}" for p in argument.premises])
-        
-        # Formater les vulnérabilités
-        if vulnerabilities:
-            vulns_str = "\n".join([
-                f"- Type: {v.type}, Cible: {v.target}, Score: {v.score:.2f}, "
-                f"Description: {v.description}"
-                for v in vulnerabilities
-            ])
-        else:
-            vulns_str = "Aucune vulnérabilité spécifique identifiée."
-        
-        # Préparer la stratégie rhétorique
-        strat_str = rhetorical_strategy.value if rhetorical_strategy else "au choix"
-        
-        prompt = format_prompt(
-            COUNTER_ARGUMENT_GENERATION_PROMPT,
-            argument_text=argument.content,
-            premises=premises_str,
-            conclusion=argument.conclusion,
-            argument_type=argument.argument_type,
-            vulnerabilities=vulns_str,
-            counter_type=counter_type.value,
-            rhetorical_strategy=strat_str
+        # Dédoublonnage des appels en vol: les demandes concurrentes identiques
+        # partagent le même Future et donc le même aller-retour réseau.
+        key = _cache_key(
+            argument.content,
+            counter_type.value,
+            rhetorical_strategy.value if rhetorical_strategy else ""
         )
-        
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            logger.debug("Génération déjà en vol pour la clé %s, attente du résultat", key)
+            return copy.deepcopy(await inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
         try:
-            response = await self.async_client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "Vous êtes un expert en argumentation. Votre tâche est de générer un contre-argument pertinent."},
-                    {"role": "user", "content": prompt}
-                ],
+            result = await self._generate_counter_argument_call(
+                argument, counter_type, vulnerabilities, rhetorical_strategy
+            )
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            del self._inflight[key]
+
+    async def _generate_counter_argument_call(
+        self,
+        argument: Argument,
+        counter_type: CounterArgumentType,
+        vulnerabilities: List[Vulnerability] = None,
+        rhetorical_strategy: RhetoricalStrategy = None
+    ) -> Dict[str, Any]:
+        """Effectue l'appel LLM de génération proprement dit (sans dédoublonnage)."""
+        messages = self._build_generation_messages(
+            argument, counter_type, vulnerabilities, rhetorical_strategy
+        )
+
+        try:
+            # La génération est l'appel le plus long: timeout élargi par appel.
+            # Le streaming recouvre la réception réseau et l'accumulation des
+            # tokens au lieu d'attendre la réponse complète avant de traiter.
+            stream = await self._acreate_completion(
+                messages=messages,
                 temperature=0.7,
                 max_tokens=1000,
-                response_format={"type": "json_object"}
+                response_format={"type": "json_object"},
+                stream=True,
+                timeout=60.0
             )
+
+            buf = []
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    buf.append(chunk.choices[0].delta.content)
+            content = ''.join(buf)
+            logger.debug("Réponse LLM pour la génération de contre-argument (async): %.100s...", content)
             
-            content = response.choices[0].message.content
-            logger.debug(f"Réponse LLM pour la génération de contre-argument (async): {content[:100]}...")
-            
-            # Parser la réponse JSON
+            # Décoder et valider la réponse JSON
             try:
-                return json.loads(content)
-            except json.JSONDecodeError:
-                logger.error(f"Erreur de décodage JSON (async): {content}")
+                return _decode_counter_argument(content)
+            except ValueError:
+                logger.error("Erreur de décodage JSON (async): %s", content)
                 return {
                     "counter_argument": "Erreur lors de la génération du contre-argument.",
                     "target_component": "unknown",
@@ -415,7 +974,7 @@ class LLMGenerator:
                 }
             
         except Exception as e:
-            logger.error(f"Erreur lors de la génération de contre-argument avec LLM (async): {e}")
+            logger.error("Erreur lors de la génération de contre-argument avec LLM (async): %s", e)
             return {
                 "counter_argument": f"Erreur lors de la génération: {str(e)}",
                 "target_component": "error",
@@ -425,55 +984,3 @@ class LLMGenerator:
                 "explanation": f"Exception: {str(e)}"
             }
     
-    def _parse_argument_analysis(self, text: str) -> Dict[str, Any]:
-        """
-        Parse la réponse du LLM pour l'analyse d'argument.
-        
-        Args:
-            text: La réponse du LLM
-            
-        Returns:
-            Un dictionnaire avec l'analyse structurée
-        """
-        result = {
-            "premises": [],
-            "conclusion": "",
-            "argument_type": "",
-            "explanation": ""
-        }
-        
-        lines = text.strip().split('\n')
-        current_section = None
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
-            if line.startswith("- Prémisses:"):
-                current_section = "premises"
-                # Extraire les prémisses s'il y en a sur la même ligne
-                content = line.replace("- Prémisses:", "").strip()
-                if content and content != "[Liste des prémisses]":
-                    result["premises"].append(content)
-            elif line.startswith("- Conclusion:"):
-                current_section = "conclusion"
-                result["conclusion"] = line.replace("- Conclusion:", "").strip()
-            elif line.startswith("- Type d'argument:"):
-                current_section = "type"
-                arg_type = line.replace("- Type d'argument:", "").strip()
-                if arg_type != "[déductif/inductif/abductif]":
-                    result["argument_type"] = arg_type
-            elif line.startswith("- Explication:"):
-                current_section = "explanation"
-                result["explanation"] = line.replace("- Explication:", "").strip()
-            elif current_section == "premises" and line.startswith("-"):
-                # Ajouter une prémisse
-                premise = line.replace("-", "", 1).strip()
-                if premise and premise != "[Liste des prémisses]":
-                    result["premises"].append(premise)
-            elif current_section == "explanation":
-                # Concaténer l'explication
-                result["explanation"] += " " + line
-        
-        return result 
\ No newline at end of file
@@ -5,17 +5,24 @@ Ce module contient les templates de prompts utilisés pour
 interagir avec les grands modèles de langage (LLMs).
 """
 
+import string
+from typing import Dict, List, Optional, Tuple
+
 # Prompt pour l'analyse d'un argument
 ARGUMENT_ANALYSIS_PROMPT = """
 Analysez la structure de l'argument suivant. Identifiez les prémisses, la conclusion, et le type d'argument.
 
 Argument: "{argument_text}"
 
-Fournissez votre analyse sous la forme suivante:
-- Prémisses: [Liste des prémisses]
-- Conclusion: [La conclusion de l'argument]
-- Type d'argument: [déductif/inductif/abductif]
-- Explication: [Courte explication sur la structure et la logique de l'argument]
+Fournissez votre réponse au format JSON:
+{{
+  "premises": ["Première prémisse", "Deuxième prémisse", ...],
+  "conclusion": "La conclusion de l'argument",
+  "argument_type": "deductive|inductive|abductive",
+  "explanation": "Courte explication sur la structure et la logique de l'argument"
+}}
+
+Les valeurs possibles pour "argument_type" sont: "deductive", "inductive", "abductive".
 """
 
 # Prompt pour l'identification des vulnérabilités
@@ -91,6 +98,49 @@ Les valeurs possibles pour "strength" sont: "weak", "moderate", "strong", "decis
 Les stratégies rhétoriques possibles sont: "socratic_questioning", "reductio_ad_absurdum", "analogical_counter", "authority_appeal", "statistical_evidence".
 """
 
+# Variante en deux parties du prompt de génération, pour le cache de préfixe
+# côté fournisseur: le squelette ne dépend que du couple (type de
+# contre-argument, stratégie rhétorique) et ouvre le message utilisateur —
+# les requêtes partageant ce couple présentent donc un préfixe de tokens
+# identique, réutilisable par le cache KV du serveur. Le contenu propre à
+# l'argument arrive en fin de message.
+COUNTER_ARGUMENT_GENERATION_SKELETON = """
+Générez un contre-argument pour l'argument qui vous sera fourni ci-dessous.
+
+Type de contre-argument à générer: {counter_type}
+Stratégie rhétorique à utiliser: {rhetorical_strategy}
+
+Générez un contre-argument pertinent et convaincant qui exploite les vulnérabilités identifiées. Utilisez la stratégie rhétorique spécifiée.
+
+Fournissez votre réponse au format JSON:
+{{
+  "counter_argument": "Texte du contre-argument",
+  "target_component": "La partie de l'argument ciblée (prémisse, conclusion, structure)",
+  "strength": "decisive|strong|moderate|weak",
+  "confidence": 0.8,
+  "supporting_evidence": ["Preuve 1", "Preuve 2", ...],
+  "rhetorical_strategy": "La stratégie rhétorique que vous avez utilisée",
+  "explanation": "Explication de la stratégie utilisée"
+}}
+
+Les valeurs possibles pour "strength" sont: "weak", "moderate", "strong", "decisive".
+Les stratégies rhétoriques possibles sont: "socratic_questioning", "reductio_ad_absurdum", "analogical_counter", "authority_appeal", "statistical_evidence".
+"""
+
+COUNTER_ARGUMENT_GENERATION_DATA = """
+Argument original: "{argument_text}"
+
+Prémisses:
+{premises}
+
+Conclusion: {conclusion}
+
+Type d'argument: {argument_type}
+
+Vulnérabilités identifiées:
+{vulnerabilities}
+"""
+
 # Prompt pour l'évaluation de contre-arguments
 COUNTER_ARGUMENT_EVALUATION_PROMPT = """
 Évaluez la qualité du contre-argument suivant.
@@ -131,15 +181,60 @@ Répondez au format JSON:
 """
 
 
+# Templates précompilés: str.format reparse le template à chaque appel, alors
+# que la liste (littéral, champ) produite par string.Formatter.parse ne change
+# jamais. Le scan du template est ainsi payé une seule fois, à l'import.
+_FORMATTER = string.Formatter()
+
+
+def _compile_template(template: str) -> List[Tuple[str, Optional[str]]]:
+    """Parse un template en une liste de segments (littéral, nom de champ)."""
+    # Les accolades doublées ({{ }}) des exemples JSON sont converties en
+    # littéraux par le Formatter, donc le résultat est directement joignable.
+    return [
+        (literal, field)
+        for literal, field, _spec, _conv in _FORMATTER.parse(template)
+    ]
+
+
+# Cache keyé par id(): sûr ici car les templates sont des constantes de module
+# qui vivent aussi longtemps que le processus.
+_COMPILED: Dict[int, List[Tuple[str, Optional[str]]]] = {}
+
+for _template in (
+    ARGUMENT_ANALYSIS_PROMPT,
+    VULNERABILITY_IDENTIFICATION_PROMPT,
+    COUNTER_ARGUMENT_GENERATION_PROMPT,
+    COUNTER_ARGUMENT_GENERATION_SKELETON,
+    COUNTER_ARGUMENT_GENERATION_DATA,
+    COUNTER_ARGUMENT_EVALUATION_PROMPT,
+):
+    _COMPILED[id(_template)] = _compile_template(_template)
+
+
 def format_prompt(template: str, **kwargs) -> str:
     """
     Formate un template de prompt avec les valeurs fournies.
-    
+
     Args:
         template: Le template de prompt à formater
         **kwargs: Les valeurs à insérer dans le template
-        
+
     Returns:
         Le prompt formaté
     """
-    return template.format(**kwargs) 
\ No newline at end of file
+    # Les templates inconnus sont compilés à la volée sans être mémorisés:
+    # mémoriser par id() une chaîne temporaire serait incorrect après
+    # réutilisation de l'adresse par l'allocateur.
+    parts = _COMPILED.get(id(template))
+    if parts is None:
+        parts = _compile_template(template)
+
+    pieces = []
+    for literal, field in parts:
+        if literal:
+            pieces.append(literal)
+        if field is not None:
+            pieces.append(str(kwargs[field]))
+
+    return ''.join(pieces)
\ No newline at end of file
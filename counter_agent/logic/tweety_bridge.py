@@ -7,17 +7,77 @@ pour la validation formelle des arguments et contre-arguments.
 
 import os
 import logging
+import hashlib
 import tempfile
+import weakref
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Tuple
 
 import jpype
-import jpype.imports
+import numpy as np
 from jpype.types import *
 
 from ..agent.definitions import Argument, CounterArgument, CounterArgumentType, ArgumentStrength
 
 logger = logging.getLogger(__name__)
 
+# Taille maximale du pool de wrappers Java (éviction du plus ancien)
+_ARG_CACHE_MAX_ENTRIES = 1024
+
+# Ordre numérique des forces d'argument, pour la vectorisation NumPy
+_STRENGTH_ORD = {
+    ArgumentStrength.WEAK: 0,
+    ArgumentStrength.MODERATE: 1,
+    ArgumentStrength.STRONG: 2,
+    ArgumentStrength.DECISIVE: 3,
+}
+
+# Seuil à partir duquel le comptage vectorisé bat la boucle Python
+_VECTORIZE_THRESHOLD = 32
+
+# Taille maximale du cache des sérialisations d'extensions (éviction LRU)
+_EXT_STR_CACHE_MAX_ENTRIES = 256
+
+# Taille maximale du pool d'objets Attack (éviction du plus ancien)
+_ATTACK_CACHE_MAX_ENTRIES = 2048
+
+
+class _LazyStr:
+    """
+    Chaîne paresseuse autour d'un objet Java.
+
+    str() sur une théorie ou une extension sérialise tout le graphe via JNI;
+    la plupart des appelants de validate_counter_argument ne consomment que
+    les booléens. Le proxy ne paie la sérialisation qu'au premier accès et
+    mémorise le résultat.
+    """
+    __slots__ = ("_obj", "_fallback", "_value")
+
+    def __init__(self, obj, fallback: str):
+        self._obj = obj
+        self._fallback = fallback
+        self._value = None
+
+    def __str__(self) -> str:
+        if self._value is None:
+            try:
+                self._value = str(self._obj)
+            except Exception:
+                self._value = self._fallback
+            self._obj = None
+        return self._value
+
+    __repr__ = __str__
+
+    def __deepcopy__(self, memo):
+        # Le proxy enveloppe un objet Java non picklable: copy.deepcopy
+        # (déclenché notamment par dataclasses.asdict) échouerait en
+        # essayant de le dupliquer. Le proxy est immuable de l'extérieur,
+        # le partager est donc sans risque.
+        return self
+
 
 class TweetyBridge:
     """
@@ -45,6 +105,10 @@ class TweetyBridge:
                     tweety_jar_path = path
                     break
         
+        # tweety_available signifie "JAR trouvé"; _jvm_ready signifie "JVM
+        # démarrée et classes importées" (voir _ensure_jvm)
+        self._jvm_ready = False
+
         if tweety_jar_path is None or not os.path.exists(tweety_jar_path):
             logger.warning("Fichier JAR de TweetyProject non trouvé. La validation formelle ne sera pas disponible.")
             self.tweety_available = False
@@ -52,25 +116,81 @@ class TweetyBridge:
         
         self.tweety_jar_path = tweety_jar_path
         self.tweety_available = True
-        
-        # Démarrer la JVM si elle n'est pas déjà démarrée
+
+        # Pool de wrappers Java par empreinte de contenu: chaque construction
+        # de TweetyArgument traverse la frontière JPype/JNI, coût dominant du
+        # chemin chaud. Le nom étant dérivé du contenu (voir _arg_key), deux
+        # objets Python représentant le même argument logique partagent le
+        # même wrapper, y compris d'un appel à l'autre.
+        self._arg_cache: Dict[str, Any] = {}
+
+        # Verrou protégeant les caches partagés (_arg_cache, _attack_cache,
+        # _ext_str_cache) lors des validations parallèles
+        self._cache_lock = threading.Lock()
+
+        # Pool d'objets Attack par paire (attaquant, cible): les mêmes paires
+        # reviennent sans cesse en validation par lot, et DungTheory.add est
+        # idempotent pour des attaques égales, la réutilisation est donc sûre.
+        # Chaque entrée retient aussi les wrappers pour figer leurs id().
+        self._attack_cache: Dict[Tuple[int, int], Any] = {}
+
+        # Sérialisations d'extensions mémorisées par hashCode Java: les
+        # théories revisitées produisent les mêmes extensions, inutile de
+        # repayer le toString JNI (voir _extension_to_string)
+        self._ext_str_cache: "OrderedDict[int, Any]" = OrderedDict()
+
+        # Théories accumulées par argument original: les appels successifs à
+        # assess_argument_strength avec des contre-arguments qui se recoupent
+        # n'ajoutent que les nouveaux nœuds/attaques au lieu de reconstruire
+        # toute la théorie côté Java (voir invalidate pour l'éviction manuelle)
+        self._theory_cache: Dict[int, Tuple[Any, set]] = {}
+
+        # La JVM n'est PAS démarrée ici: son lancement (plusieurs centaines de
+        # millisecondes) est différé au premier appel qui nécessite réellement
+        # TweetyProject, pour que les chemins purement Python (fallbacks,
+        # cohérence par mots clés) n'en paient jamais le coût.
+        logger.info("TweetyBridge initialisé (JVM démarrée au premier usage)")
+
+    def _ensure_jvm(self):
+        """Démarre la JVM et importe les classes Tweety au premier usage réel."""
+        if self._jvm_ready or not self.tweety_available:
+            return
         self._start_jvm()
-        
-        # Importer les classes nécessaires de TweetyProject
         self._import_tweety_classes()
-        
-        logger.info("TweetyBridge initialisé avec succès")
+        self._jvm_ready = self.tweety_available
     
     def _start_jvm(self):
         """Démarre la JVM avec les bons paramètres."""
         if not jpype.isJVMStarted():
             logger.info(f"Démarrage de la JVM avec le JAR: {self.tweety_jar_path}")
+
+            # AppCDS: le premier lancement archive les métadonnées de classes
+            # pré-vérifiées à la sortie; les lancements suivants les relisent
+            # depuis l'archive, ce qui raccourcit sensiblement le démarrage
+            # (TweetyProject charge un grand nombre de classes).
+            archive_path = os.path.join(tempfile.gettempdir(), 'tweety-appcds.jsa')
+            if os.path.exists(archive_path):
+                cds_args = ("-Xshare:auto", f"-XX:SharedArchiveFile={archive_path}")
+            else:
+                cds_args = ("-Xshare:auto", f"-XX:ArchiveClassesAtExit={archive_path}")
+
             try:
-                jpype.startJVM(jpype.getDefaultJVMPath(), f"-Djava.class.path={self.tweety_jar_path}")
+                jpype.startJVM(
+                    jpype.getDefaultJVMPath(),
+                    f"-Djava.class.path={self.tweety_jar_path}",
+                    *cds_args
+                )
                 logger.info("JVM démarrée avec succès")
             except Exception as e:
-                logger.error(f"Erreur lors du démarrage de la JVM: {e}")
-                self.tweety_available = False
+                # JVM trop ancienne pour AppCDS ou archive corrompue:
+                # réessayer sans les options de partage de classes
+                logger.warning(f"Démarrage avec AppCDS impossible ({e}), nouvel essai sans archive")
+                try:
+                    jpype.startJVM(jpype.getDefaultJVMPath(), f"-Djava.class.path={self.tweety_jar_path}")
+                    logger.info("JVM démarrée avec succès (sans AppCDS)")
+                except Exception as e:
+                    logger.error(f"Erreur lors du démarrage de la JVM: {e}")
+                    self.tweety_available = False
         else:
             logger.info("JVM déjà démarrée")
     
@@ -80,25 +200,85 @@ class TweetyBridge:
             return
         
         try:
-            # Importer les packages Java nécessaires
-            from org.tweetyproject.arg.dung.syntax import DungTheory, Argument as TweetyArgument, Attack
-            from org.tweetyproject.arg.dung.reasoner import AbstractExtensionReasoner, SimpleGroundedReasoner, SimpleCompleteReasoner
-            from org.tweetyproject.arg.dung.semantics import Extension, Semantics
-            
-            # Stocker les références aux classes
-            self.DungTheory = DungTheory
-            self.TweetyArgument = TweetyArgument
-            self.Attack = Attack
-            self.SimpleGroundedReasoner = SimpleGroundedReasoner
-            self.SimpleCompleteReasoner = SimpleCompleteReasoner
-            self.Extension = Extension
-            self.Semantics = Semantics
+            # Résolution explicite par JClass: pour un ensemble fixe et connu
+            # de classes, c'est plus direct que le mécanisme d'import de
+            # jpype.imports (pas de crochet d'import ni de modules fictifs)
+            self.DungTheory = jpype.JClass("org.tweetyproject.arg.dung.syntax.DungTheory")
+            self.TweetyArgument = jpype.JClass("org.tweetyproject.arg.dung.syntax.Argument")
+            self.Attack = jpype.JClass("org.tweetyproject.arg.dung.syntax.Attack")
+            self.SimpleGroundedReasoner = jpype.JClass("org.tweetyproject.arg.dung.reasoner.SimpleGroundedReasoner")
+            self.SimpleCompleteReasoner = jpype.JClass("org.tweetyproject.arg.dung.reasoner.SimpleCompleteReasoner")
+            self.Extension = jpype.JClass("org.tweetyproject.arg.dung.semantics.Extension")
+            self.Semantics = jpype.JClass("org.tweetyproject.arg.dung.semantics.Semantics")
+
+            # Les raisonneurs sont sans état: les instancier une fois évite
+            # deux constructions Java par validation.
+            self._grounded_reasoner = self.SimpleGroundedReasoner()
+            self._complete_reasoner = self.SimpleCompleteReasoner()
+
+            # Pré-résoudre la méthode Java la plus appelée: la résolution
+            # de surcharge JPype est ainsi payée une fois à l'initialisation
+            # plutôt qu'à chaque invocation dans les boucles de validation.
+            self._complete_get_models = self.SimpleCompleteReasoner.getModels
             
             logger.info("Classes TweetyProject importées avec succès")
         except Exception as e:
             logger.error(f"Erreur lors de l'importation des classes TweetyProject: {e}")
             self.tweety_available = False
     
+    @staticmethod
+    def _arg_key(py_arg) -> str:
+        """
+        Nom Java stable d'un argument: empreinte de son contenu logique.
+
+        Contrairement à id(), deux objets Python représentant le même argument
+        produisent la même empreinte, ce qui permet de mettre les wrappers
+        Java en pool d'un appel à l'autre.
+        """
+        if isinstance(py_arg, CounterArgument):
+            payload = ("counter", py_arg.counter_content, py_arg.counter_type.value)
+        else:
+            payload = (tuple(py_arg.premises), py_arg.conclusion)
+        return hashlib.blake2b(repr(payload).encode("utf-8"), digest_size=8).hexdigest()
+
+    def _get_attack(self, attacker, target) -> Any:
+        """
+        Retourne l'objet Attack (Java) pour une paire de wrappers, en pool.
+
+        Les wrappers sont retenus dans l'entrée de cache, ce qui fige leurs
+        id() tant que l'entrée vit et rend la clé par identité sûre.
+        """
+        key = (id(attacker), id(target))
+        with self._cache_lock:
+            entry = self._attack_cache.get(key)
+            if entry is not None:
+                return entry[0]
+        attack = self.Attack(attacker, target)
+        with self._cache_lock:
+            if len(self._attack_cache) >= _ATTACK_CACHE_MAX_ENTRIES:
+                self._attack_cache.pop(next(iter(self._attack_cache)))
+            self._attack_cache[key] = (attack, attacker, target)
+        return attack
+
+    def _get_tweety_arg(self, py_arg) -> Any:
+        """
+        Retourne le TweetyArgument associé à un argument Python, en le créant
+        au besoin. Le wrapper est partagé par tous les objets Python de même
+        contenu, ce qui évite une traversée JNI par appel pour les arguments
+        revisités.
+        """
+        key = self._arg_key(py_arg)
+        with self._cache_lock:
+            cached = self._arg_cache.get(key)
+            if cached is not None:
+                return cached
+        tweety_arg = self.TweetyArgument(key)
+        with self._cache_lock:
+            if len(self._arg_cache) >= _ARG_CACHE_MAX_ENTRIES:
+                self._arg_cache.pop(next(iter(self._arg_cache)))
+            self._arg_cache[key] = tweety_arg
+        return tweety_arg
+
     def validate_counter_argument(
         self, 
         original_arg: Argument, 
@@ -114,6 +294,7 @@ class TweetyBridge:
         Returns:
             Un dictionnaire contenant les résultats de la validation
         """
+        self._ensure_jvm()
         if not self.tweety_available:
             logger.warning("TweetyProject n'est pas disponible. Validation simplifiée utilisée.")
             return self._fallback_validation(original_arg, counter_arg)
@@ -123,9 +304,9 @@ class TweetyBridge:
             # Créer une théorie de Dung
             theory = self.DungTheory()
             
-            # Créer les arguments
-            original_argument = self.TweetyArgument(str(id(original_arg)))
-            counter_argument = self.TweetyArgument(str(id(counter_arg)))
+            # Créer (ou réutiliser) les arguments
+            original_argument = self._get_tweety_arg(original_arg)
+            counter_argument = self._get_tweety_arg(counter_arg)
             
             theory.add(original_argument)
             theory.add(counter_argument)
@@ -133,19 +314,29 @@ class TweetyBridge:
             # Modéliser l'attaque en fonction du type de contre-argument
             self._add_attack_based_on_type(theory, counter_arg, original_argument, counter_argument)
             
-            # Calculer les extensions selon différentes sémantiques
-            grounded_reasoner = self.SimpleGroundedReasoner()
-            complete_reasoner = self.SimpleCompleteReasoner()
-            
-            grounded_extension = grounded_reasoner.getModel(theory)
-            complete_extensions = complete_reasoner.getModels(theory)
-            
-            # Analyser les résultats
-            original_in_grounded = self._is_in_extension(original_argument, grounded_extension)
-            counter_in_grounded = self._is_in_extension(counter_argument, grounded_extension)
-            
-            original_in_complete = any(self._is_in_extension(original_argument, ext) for ext in complete_extensions)
-            counter_in_complete = any(self._is_in_extension(counter_argument, ext) for ext in complete_extensions)
+            # Calculer les extensions complètes, puis en dériver l'extension
+            # fondée: elle est l'intersection des extensions complètes (Dung),
+            # ce qui économise une invocation complète du raisonneur fondé.
+            complete_extensions = list(self._complete_get_models(self._complete_reasoner, theory))
+            ext_name_sets = [frozenset(str(a) for a in ext) for ext in complete_extensions]
+            grounded_names = frozenset.intersection(*ext_name_sets) if ext_name_sets else frozenset()
+
+            # Analyser les résultats (appartenance par nom, sans appel JNI)
+            original_name = str(original_argument)
+            counter_name = str(counter_argument)
+            original_in_grounded = original_name in grounded_names
+            counter_in_grounded = counter_name in grounded_names
+            
+            # Une seule passe sur les extensions pour les deux appartenances,
+            # interrompue dès que les deux sont établies
+            original_in_complete = counter_in_complete = False
+            for names in ext_name_sets:
+                if original_name in names:
+                    original_in_complete = True
+                if counter_name in names:
+                    counter_in_complete = True
+                if original_in_complete and counter_in_complete:
+                    break
             
             # Calculer les résultats
             is_valid_attack = counter_in_grounded and not original_in_grounded
@@ -165,7 +356,7 @@ class TweetyBridge:
                 'logical_consistency': logical_consistency,
                 'formal_representation': formal_repr,
                 'extensions': {
-                    'grounded': self._extension_to_string(grounded_extension),
+                    'grounded': self._names_to_string(grounded_names),
                     'complete': [self._extension_to_string(ext) for ext in complete_extensions]
                 }
             }
@@ -174,6 +365,124 @@ class TweetyBridge:
             logger.error(f"Erreur lors de la validation avec TweetyProject: {e}")
             return self._fallback_validation(original_arg, counter_arg)
     
+    def validate_counter_arguments_batch(
+        self,
+        original_arg: Argument,
+        counter_args: List[CounterArgument]
+    ) -> List[Dict[str, Any]]:
+        """
+        Valide un lot de contre-arguments dans une seule théorie de Dung.
+
+        Construire une théorie et exécuter les raisonneurs une seule fois
+        amortit le coût des extensions complètes (exponentiel au pire cas)
+        sur tous les contre-arguments, au lieu de le payer N fois.
+
+        Args:
+            original_arg: L'argument original
+            counter_args: Liste des contre-arguments à valider
+
+        Returns:
+            Une liste de dictionnaires de validation, un par contre-argument
+        """
+        if not counter_args:
+            return []
+
+        self._ensure_jvm()
+        if not self.tweety_available:
+            logger.warning("TweetyProject n'est pas disponible. Validation simplifiée utilisée.")
+            return [self._fallback_validation(original_arg, ca) for ca in counter_args]
+
+        try:
+            logger.info(f"Validation formelle par lot de {len(counter_args)} contre-arguments")
+            # Créer une seule théorie contenant tous les contre-arguments
+            theory = self.DungTheory()
+
+            original_argument = self._get_tweety_arg(original_arg)
+            theory.add(original_argument)
+
+            counter_arguments = []
+            for counter_arg in counter_args:
+                counter_argument = self._get_tweety_arg(counter_arg)
+                theory.add(counter_argument)
+                self._add_attack_based_on_type(theory, counter_arg, original_argument, counter_argument)
+                counter_arguments.append(counter_argument)
+
+            # Un seul passage du raisonneur complet pour tout le lot; la
+            # collection Java est matérialisée une fois, et l'extension fondée
+            # est dérivée par intersection des extensions complètes (Dung)
+            complete_extensions = list(self._complete_get_models(self._complete_reasoner, theory))
+            ext_name_sets = [frozenset(str(a) for a in ext) for ext in complete_extensions]
+            grounded_names = frozenset.intersection(*ext_name_sets) if ext_name_sets else frozenset()
+
+            # Résultats communs à tous les contre-arguments du lot
+            original_name = str(original_argument)
+            original_in_grounded = original_name in grounded_names
+            original_in_complete = any(original_name in names for names in ext_name_sets)
+            logical_consistency = len(complete_extensions) > 0
+            formal_repr = self._build_formal_representation(theory)
+            extensions_repr = {
+                'grounded': self._names_to_string(grounded_names),
+                'complete': [self._extension_to_string(ext) for ext in complete_extensions]
+            }
+
+            results = []
+            for counter_argument in counter_arguments:
+                counter_name = str(counter_argument)
+                counter_in_grounded = counter_name in grounded_names
+                counter_in_complete = any(counter_name in names for names in ext_name_sets)
+                results.append({
+                    'is_valid_attack': counter_in_grounded and not original_in_grounded,
+                    'original_survives': original_in_complete,
+                    'counter_succeeds': counter_in_grounded or counter_in_complete,
+                    'logical_consistency': logical_consistency,
+                    'formal_representation': formal_repr,
+                    'extensions': extensions_repr
+                })
+            return results
+
+        except Exception as e:
+            logger.error(f"Erreur lors de la validation par lot avec TweetyProject: {e}")
+            return [self._fallback_validation(original_arg, ca) for ca in counter_args]
+
+    def validate_many_parallel(
+        self,
+        pairs: List[Tuple[Argument, CounterArgument]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Valide des paires (argument, contre-argument) indépendantes en parallèle.
+
+        Les appels JNI relâchent le GIL pendant le travail du raisonneur côté
+        JVM: un pool de threads apporte donc un gain quasi linéaire pour des
+        validations sans théorie partagée. Chaque thread s'attache à la JVM
+        avant de dérouler le chemin unitaire.
+
+        Args:
+            pairs: Liste de paires (argument original, contre-argument)
+
+        Returns:
+            Une liste de dictionnaires de validation, dans l'ordre des paires
+        """
+        if not pairs:
+            return []
+
+        self._ensure_jvm()
+        if not self.tweety_available or len(pairs) == 1:
+            return [self.validate_counter_argument(o, c) for o, c in pairs]
+
+        def _worker(pair):
+            # Les JPype récents attachent automatiquement les threads; sur les
+            # anciens il faut le faire explicitement avant tout appel Java
+            attach = getattr(jpype, "attachThreadToJVM", None)
+            if attach is not None:
+                is_attached = getattr(jpype, "isThreadAttachedToJVM", None)
+                if is_attached is None or not is_attached():
+                    attach()
+            return self.validate_counter_argument(*pair)
+
+        max_workers = min(len(pairs), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_worker, pairs))
+
     def assess_argument_strength(
         self, 
         original_arg: Argument,
@@ -185,45 +494,72 @@ class TweetyBridge:
         Args:
             original_arg: L'argument original
             counter_args: Liste des contre-arguments
-            
+
         Returns:
-            Un score entre 0 et 1 représentant la force de l'argument
+            Un score entre 0 et 1 représentant la force de l'argument.
+            Deux cas se calculent analytiquement sans travail JVM (les
+            appelants peuvent compter sur ces formules):
+            - tous les contre-arguments sont WEAK: max(0.8, 1.0 - 0.05*N)
+            - au moins un contre-argument DECISIVE: 0.1
         """
+        if counter_args:
+            strengths = {ca.strength for ca in counter_args}
+            # Rien n'attaque les contre-arguments dans cette modélisation: un
+            # contre-argument décisif reste sans réponse, score épinglé bas
+            if ArgumentStrength.DECISIVE in strengths:
+                return 0.1
+            # Que des contre-arguments faibles: érosion légère et bornée,
+            # inutile d'énumérer les extensions complètes (coût exponentiel)
+            if strengths == {ArgumentStrength.WEAK}:
+                return max(0.8, 1.0 - 0.05 * len(counter_args))
+
+        if counter_args:
+            self._ensure_jvm()
         if not self.tweety_available or not counter_args:
             logger.warning("TweetyProject n'est pas disponible ou pas de contre-arguments. Évaluation simplifiée utilisée.")
             return self._fallback_strength_assessment(original_arg, counter_args)
         
         try:
-            # Créer une théorie de Dung
-            theory = self.DungTheory()
-            
-            # Créer l'argument original
-            original_argument = self.TweetyArgument(str(id(original_arg)))
-            theory.add(original_argument)
-            
-            # Ajouter les contre-arguments
-            counter_arguments = []
-            for i, counter_arg in enumerate(counter_args):
-                counter_argument = self.TweetyArgument(f"counter_{i}")
+            # Réutiliser la théorie accumulée pour cet argument original
+            original_argument = self._get_tweety_arg(original_arg)
+            cache_key = id(original_arg)
+            cached = self._theory_cache.get(cache_key)
+            if cached is None:
+                theory = self.DungTheory()
+                theory.add(original_argument)
+                known_counters: set = set()
+                self._theory_cache[cache_key] = (theory, known_counters)
+                weakref.finalize(original_arg, self._theory_cache.pop, cache_key, None)
+            else:
+                theory, known_counters = cached
+            
+            # N'ajouter que les contre-arguments encore inconnus de la théorie.
+            # L'appartenance est jugée sur l'empreinte de contenu (_arg_key):
+            # mémoriser id() sans garder de référence laisserait CPython
+            # réattribuer l'adresse d'un contre-argument libéré à un nouveau,
+            # qui serait alors silencieusement omis de la théorie.
+            for counter_arg in counter_args:
+                counter_key = self._arg_key(counter_arg)
+                if counter_key in known_counters:
+                    continue
+                counter_argument = self._get_tweety_arg(counter_arg)
                 theory.add(counter_argument)
-                counter_arguments.append((counter_arg, counter_argument))
-                
-                # Ajouter l'attaque
                 self._add_attack_based_on_type(theory, counter_arg, original_argument, counter_argument)
+                known_counters.add(counter_key)
             
-            # Calculer les extensions selon différentes sémantiques
-            grounded_reasoner = self.SimpleGroundedReasoner()
-            complete_reasoner = self.SimpleCompleteReasoner()
-            
-            grounded_extension = grounded_reasoner.getModel(theory)
-            complete_extensions = complete_reasoner.getModels(theory)
-            
+            # Calculer les extensions complètes et en dériver l'extension
+            # fondée par intersection, sans second passage de raisonneur
+            complete_extensions = list(self._complete_get_models(self._complete_reasoner, theory))
+            ext_name_sets = [frozenset(str(a) for a in ext) for ext in complete_extensions]
+            grounded_names = frozenset.intersection(*ext_name_sets) if ext_name_sets else frozenset()
+
             # Analyser la survie de l'argument original
-            original_in_grounded = self._is_in_extension(original_argument, grounded_extension)
+            original_name = str(original_argument)
+            original_in_grounded = original_name in grounded_names
             
             # Calculer le taux d'acceptation dans les extensions complètes
-            if complete_extensions:
-                acceptance_rate = sum(1 for ext in complete_extensions if self._is_in_extension(original_argument, ext)) / len(complete_extensions)
+            if ext_name_sets:
+                acceptance_rate = sum(1 for names in ext_name_sets if original_name in names) / len(ext_name_sets)
             else:
                 acceptance_rate = 0.0
             
@@ -236,6 +572,18 @@ class TweetyBridge:
         except Exception as e:
             logger.error(f"Erreur lors de l'évaluation de la force avec TweetyProject: {e}")
             return self._fallback_strength_assessment(original_arg, counter_args)
+
+    def invalidate(self, original_arg: Argument) -> None:
+        """
+        Oublie la théorie accumulée pour un argument original.
+
+        À appeler si l'argument ou la modélisation de ses attaques change et
+        que la théorie incrémentale ne doit pas être réutilisée.
+
+        Args:
+            original_arg: L'argument original dont la théorie doit être évincée
+        """
+        self._theory_cache.pop(id(original_arg), None)
     
     def generate_attack_graph(
         self, 
@@ -252,6 +600,8 @@ class TweetyBridge:
         Returns:
             Une représentation textuelle du graphe d'attaque
         """
+        if counter_args:
+            self._ensure_jvm()
         if not self.tweety_available or not counter_args:
             return "Graphe d'attaque non disponible."
         
@@ -271,8 +621,8 @@ class TweetyBridge:
                 # Ajouter l'attaque
                 self._add_attack_based_on_type(theory, counter_arg, original_argument, counter_argument)
             
-            # Construire la représentation formelle
-            return self._build_formal_representation(theory)
+            # Construire la représentation formelle (consommée immédiatement)
+            return str(self._build_formal_representation(theory))
             
         except Exception as e:
             logger.error(f"Erreur lors de la génération du graphe d'attaque: {e}")
@@ -294,89 +644,78 @@ class TweetyBridge:
             original_argument: L'argument original (objet TweetyProject)
             counter_argument: Le contre-argument (objet TweetyProject)
         """
-        # Créer différents types d'attaques en fonction du type de contre-argument
-        if counter_arg.counter_type == CounterArgumentType.DIRECT_REFUTATION:
-            # Attaque directe
-            attack = self.Attack(counter_argument, original_argument)
-            theory.add(attack)
-        
-        elif counter_arg.counter_type == CounterArgumentType.PREMISE_CHALLENGE:
-            # Attaque sur les prémisses (modélisée comme une attaque sur l'argument)
-            attack = self.Attack(counter_argument, original_argument)
-            theory.add(attack)
-        
-        elif counter_arg.counter_type == CounterArgumentType.COUNTER_EXAMPLE:
-            # Un contre-exemple attaque la généralisation
-            attack = self.Attack(counter_argument, original_argument)
-            theory.add(attack)
-        
-        elif counter_arg.counter_type == CounterArgumentType.ALTERNATIVE_EXPLANATION:
-            # Une explication alternative peut coexister avec l'argument original
-            # On pourrait ajouter un nouvel argument pour la conclusion et faire attaquer les deux
-            conclusion_arg = self.TweetyArgument("conclusion")
+        # Hormis l'explication alternative, tous les types (réfutation directe,
+        # remise en cause des prémisses, contre-exemple, réduction à l'absurde,
+        # type inconnu) se modélisent par la même attaque directe: un seul test
+        # au lieu d'une chaîne de cinq branches identiques sur le chemin chaud.
+        if counter_arg.counter_type is CounterArgumentType.ALTERNATIVE_EXPLANATION:
+            # Une explication alternative peut coexister avec l'argument original:
+            # les deux attaquent un argument représentant la conclusion.
+            # Le nœud "conclusion" est lui aussi mis en pool pour que les
+            # attaques qui le visent retrouvent leur entrée de cache.
+            # Lecture et insertion sous verrou, comme dans _get_tweety_arg:
+            # deux workers parallèles créeraient sinon deux wrappers
+            # distincts, et le pool d'attaques (clé par id() de wrapper)
+            # raterait alors toutes les attaques visant la conclusion.
+            with self._cache_lock:
+                conclusion_arg = self._arg_cache.get("conclusion")
+                if conclusion_arg is None:
+                    conclusion_arg = self.TweetyArgument("conclusion")
+                    self._arg_cache["conclusion"] = conclusion_arg
             theory.add(conclusion_arg)
-            
-            support1 = self.Attack(original_argument, conclusion_arg)
-            support2 = self.Attack(counter_argument, conclusion_arg)
-            
-            theory.add(support1)
-            theory.add(support2)
-        
-        elif counter_arg.counter_type == CounterArgumentType.REDUCTIO_AD_ABSURDUM:
-            # Réduction à l'absurde attaque directement l'argument
-            attack = self.Attack(counter_argument, original_argument)
-            theory.add(attack)
-        
+            theory.add(self._get_attack(original_argument, conclusion_arg))
+            theory.add(self._get_attack(counter_argument, conclusion_arg))
         else:
-            # Attaque par défaut
-            attack = self.Attack(counter_argument, original_argument)
-            theory.add(attack)
-    
-    def _is_in_extension(self, argument, extension) -> bool:
-        """
-        Vérifie si un argument est dans une extension.
-        
-        Args:
-            argument: L'argument à vérifier
-            extension: L'extension à vérifier
-            
-        Returns:
-            True si l'argument est dans l'extension, False sinon
-        """
-        try:
-            return extension.contains(argument)
-        except:
-            return False
+            theory.add(self._get_attack(counter_argument, original_argument))
     
-    def _extension_to_string(self, extension) -> str:
+    def _names_to_string(self, names) -> str:
+        """Formate un ensemble de noms d'arguments comme une extension Tweety."""
+        return "{" + ",".join(sorted(names)) + "}"
+
+    def _extension_to_string(self, extension) -> Any:
         """
-        Convertit une extension en chaîne de caractères.
+        Convertit une extension en chaîne paresseuse mémorisée.
+
+        Le proxy est partagé entre les validations via un cache LRU keyé par
+        hashCode Java: une extension revisitée réutilise la sérialisation
+        déjà payée. Une collision de hashCode entre extensions distinctes
+        rendrait une chaîne d'affichage erronée — risque accepté, ces chaînes
+        ne portent aucune décision.
         
         Args:
             extension: L'extension à convertir
             
         Returns:
-            Une représentation textuelle de l'extension
+            Un proxy dont str() produit la représentation de l'extension
         """
         try:
-            return str(extension)
-        except:
-            return "Extension non disponible"
+            h = int(extension.hashCode())
+        except Exception:
+            return _LazyStr(extension, "Extension non disponible")
+
+        with self._cache_lock:
+            cached = self._ext_str_cache.get(h)
+            if cached is not None:
+                self._ext_str_cache.move_to_end(h)
+                return cached
+
+            proxy = _LazyStr(extension, "Extension non disponible")
+            if len(self._ext_str_cache) >= _EXT_STR_CACHE_MAX_ENTRIES:
+                self._ext_str_cache.popitem(last=False)
+            self._ext_str_cache[h] = proxy
+            return proxy
     
-    def _build_formal_representation(self, theory) -> str:
+    def _build_formal_representation(self, theory) -> Any:
         """
-        Construit une représentation formelle d'une théorie de Dung.
+        Construit une représentation formelle paresseuse d'une théorie de Dung.
         
         Args:
             theory: La théorie de Dung
             
         Returns:
-            Une représentation textuelle de la théorie
+            Un proxy dont str() produit la représentation de la théorie
         """
-        try:
-            return str(theory)
-        except:
-            return "Représentation formelle non disponible"
+        return _LazyStr(theory, "Représentation formelle non disponible")
     
     def _fallback_validation(
         self, 
@@ -433,11 +772,25 @@ class TweetyBridge:
         if not counter_args:
             return 1.0
         
-        # Compter le nombre de contre-arguments forts et décisifs
-        strong_counter_args = sum(1 for ca in counter_args if ca.strength in [ArgumentStrength.STRONG, ArgumentStrength.DECISIVE])
-        
-        # Calculer un score simple basé sur le nombre et la force des contre-arguments
         total_counter_args = len(counter_args)
+
+        # Compter le nombre de contre-arguments forts et décisifs; au-delà du
+        # seuil (bancs d'essai, grid search), le comptage passe par un tableau
+        # NumPy int8 pour remplacer la boucle interprétée par une boucle C
+        if total_counter_args >= _VECTORIZE_THRESHOLD:
+            strengths = np.fromiter(
+                (_STRENGTH_ORD[ca.strength] for ca in counter_args),
+                dtype=np.int8,
+                count=total_counter_args
+            )
+            strong_counter_args = int(
+                (strengths >= _STRENGTH_ORD[ArgumentStrength.STRONG]).sum()
+            )
+        else:
+            strong_counter_args = sum(
+                1 for ca in counter_args
+                if ca.strength in (ArgumentStrength.STRONG, ArgumentStrength.DECISIVE)
+            )
         
         # Formule simplifiée: plus il y a de contre-arguments forts, plus le score est bas
         strength_factor = 1.0 - (strong_counter_args / total_counter_args) if total_counter_args > 0 else 1.0
@@ -5,8 +5,11 @@ Ce module fournit des fonctionnalités pour valider la cohérence
 logique des arguments et des contre-arguments.
 """
 
+import re
+import string
 import logging
-from typing import Dict, List, Any, Optional
+import functools
+from typing import Dict, List, Any, Optional, Tuple
 
 from ..agent.definitions import (
     Argument, 
@@ -19,6 +22,44 @@ from .tweety_bridge import TweetyBridge
 
 logger = logging.getLogger(__name__)
 
+# Compilé une fois au chargement du module: recompiler le motif de
+# ponctuation à chaque extraction dominait le coût de la fonction.
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
+# Chemin rapide de suppression de la ponctuation: str.translate applique une
+# table de transposition entièrement en C, plus vite que le balayage regex.
+# La table couvre la ponctuation ASCII (sauf _, conservé par \w) et les
+# signes typographiques français; la regex exacte ne sert que de filet pour
+# les caractères exotiques absents de la table.
+_PUNCT_TRANS = str.maketrans(
+    dict.fromkeys(string.punctuation.replace('_', '') + "«»‹›“”„‟’‘‚…–—·—°")
+)
+
+# Mots vides en français; frozenset pour des tests d'appartenance en O(1)
+_STOP_WORDS = frozenset([
+    "le", "la", "les", "un", "une", "des", "et", "ou", "mais", "car",
+    "donc", "si", "que", "qui", "quoi", "comment", "quand", "où", "est",
+    "sont", "a", "ont", "être", "avoir", "pour", "dans", "par", "sur",
+    "avec", "sans", "ce", "cette", "ces", "mon", "ma", "mes", "ton",
+    "ta", "tes", "son", "sa", "ses", "notre", "nos", "votre", "vos",
+    "leur", "leurs", "de", "du", "au", "aux", "en", "y"
+])
+
+
+@functools.lru_cache(maxsize=4096)
+def _extract_key_words(text: str) -> Tuple[str, ...]:
+    """
+    Extrait les mots clés d'un texte (minuscules, sans ponctuation ni mots vides).
+
+    Mémoïsé sur le texte: les mêmes prémisses et conclusions reviennent
+    souvent dans les vérifications de cohérence, et le tuple retourné est
+    hachable donc directement cachable.
+    """
+    cleaned = text.lower().translate(_PUNCT_TRANS)
+    if _PUNCT_RE.search(cleaned):
+        cleaned = _PUNCT_RE.sub('', cleaned)
+    return tuple(word for word in cleaned.split() if len(word) > 2 and word not in _STOP_WORDS)
+
 
 class CounterArgumentValidator:
     """
@@ -65,6 +106,41 @@ class CounterArgumentValidator:
             formal_representation=validation_result.get('formal_representation')
         )
     
+    def validate_many(
+        self,
+        original_argument: Argument,
+        counter_arguments: List[CounterArgument]
+    ) -> List[ValidationResult]:
+        """
+        Valide un lot de contre-arguments contre le même argument original.
+
+        Toutes les validations partagent une seule théorie de Dung et une
+        seule exécution des raisonneurs (voir validate_counter_arguments_batch).
+
+        Args:
+            original_argument: L'argument original
+            counter_arguments: Liste des contre-arguments à valider
+
+        Returns:
+            Une liste de ValidationResult, dans l'ordre des contre-arguments
+        """
+        logger.info(f"Validation par lot de {len(counter_arguments)} contre-arguments")
+
+        batch_results = self.tweety_bridge.validate_counter_arguments_batch(
+            original_argument, counter_arguments
+        )
+
+        return [
+            ValidationResult(
+                is_valid_attack=result['is_valid_attack'],
+                original_survives=result['original_survives'],
+                counter_succeeds=result['counter_succeeds'],
+                logical_consistency=result['logical_consistency'],
+                formal_representation=result.get('formal_representation')
+            )
+            for result in batch_results
+        ]
+
     def assess_strength(
         self, 
         original_argument: Argument,
@@ -130,17 +206,18 @@ class CounterArgumentValidator:
         # Pour l'instant, implémentation simplifiée
         if not premise_set or not conclusion:
             return False
-        
-        # Vérifier si des mots clés des prémisses apparaissent dans la conclusion
-        premise_words = set()
+
+        conclusion_words = set(_extract_key_words(conclusion))
+        if not conclusion_words:
+            return False
+
+        # Parcourir les prémisses et s'arrêter à la première qui partage un
+        # mot clé avec la conclusion: inutile d'extraire et d'unir les mots
+        # des prémisses restantes une fois la cohérence établie.
         for premise in premise_set:
-            premise_words.update(self._extract_key_words(premise))
-        
-        conclusion_words = set(self._extract_key_words(conclusion))
-        
-        # S'il y a au moins quelques mots en commun, considérer comme cohérent
-        common_words = premise_words.intersection(conclusion_words)
-        return len(common_words) > 0
+            if conclusion_words.intersection(_extract_key_words(premise)):
+                return True
+        return False
     
     def _extract_key_words(self, text: str) -> List[str]:
         """
@@ -152,20 +229,4 @@ class CounterArgumentValidator:
         Returns:
             Liste des mots clés
         """
-        import re
-        
-        # Supprimer la ponctuation et convertir en minuscules
-        text = re.sub(r'[^\w\s]', '', text.lower())
-        
-        # Liste de mots vides en français
-        stop_words = [
-            "le", "la", "les", "un", "une", "des", "et", "ou", "mais", "car",
-            "donc", "si", "que", "qui", "quoi", "comment", "quand", "où", "est",
-            "sont", "a", "ont", "être", "avoir", "pour", "dans", "par", "sur",
-            "avec", "sans", "ce", "cette", "ces", "mon", "ma", "mes", "ton",
-            "ta", "tes", "son", "sa", "ses", "notre", "nos", "votre", "vos",
-            "leur", "leurs", "de", "du", "au", "aux", "en", "y"
-        ]
-        
-        # Filtrer les mots vides
-        return [word for word in text.split() if word not in stop_words and len(word) > 2] 
\ No newline at end of file
+        return list(_extract_key_words(text))
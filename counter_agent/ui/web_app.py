@@ -7,20 +7,32 @@ avec l'agent de génération de contre-arguments.
 
 import os
 import json
+import time
+import hashlib
 import logging
-from typing import Dict, List, Any, Optional
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 
-from flask import Flask, request, jsonify, render_template
-import traceback
+from flask import Flask, request, jsonify, render_template, Response, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+
+# Encodeur JSON rapide optionnel (C + SIMD): retombe sur le module json de
+# la bibliothèque standard s'il n'est pas installé
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from ..agent.counter_agent import CounterArgumentAgent
 from ..agent.definitions import CounterArgumentType, RhetoricalStrategy
 
-# Configuration du logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# La configuration du logging appartient au point d'entrée (run_app): un
+# basicConfig à l'import verrouillerait le logger racine avant que
+# setup_logging puisse attacher ses propres handlers
 logger = logging.getLogger(__name__)
 
 # Initialiser l'application Flask
@@ -30,14 +42,196 @@ app = Flask(
     static_folder=os.path.join(os.path.dirname(__file__), 'static')
 )
 
+if orjson is not None:
+    class _OrjsonProvider(DefaultJSONProvider):
+        """Fournisseur JSON de Flask branché sur orjson (2 à 5x plus rapide)."""
+
+        def dumps(self, obj: Any, **kwargs: Any) -> str:
+            return orjson.dumps(obj, default=self.default).decode('utf-8')
+
+        def loads(self, s, **kwargs: Any) -> Any:
+            return orjson.loads(s)
+
+    app.json = _OrjsonProvider(app)
+
+
+def _json_dumps_bytes(obj: Any) -> bytes:
+    """Encode un objet en octets JSON via orjson si disponible."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
 # Variables globales
 agent = None
 agent_config = None
 
+# Tables valeur -> membre d'énumération, précalculées: un get de dict
+# remplace le parcours linéaire de l'énumération (et le try/except associé)
+# à chaque requête de génération
+_CT_BY_VALUE = {ct.value: ct for ct in CounterArgumentType}
+_RS_BY_VALUE = {rs.value: rs for rs in RhetoricalStrategy}
+
+# Verrou de construction de l'agent: sous un serveur à threads, deux
+# premières requêtes simultanées construiraient chacune un agent (JVM,
+# clients LLM) et l'un des deux fuirait
+_agent_lock = threading.Lock()
+
+
+def _get_agent() -> CounterArgumentAgent:
+    """
+    Retourne l'agent partagé, en le construisant au plus une fois.
+
+    start_app le construit normalement avant le démarrage du serveur; ce
+    chemin ne sert de filet que si le module est utilisé sans start_app.
+    """
+    global agent
+    if agent is not None:
+        return agent
+    with _agent_lock:
+        if agent is None:
+            agent = CounterArgumentAgent(agent_config)
+        return agent
+
+# Cache de réponses pour /analyze et /generate: le même argument est souvent
+# resoumis tel quel pendant l'exploration de l'interface, et chaque requête
+# repayait sinon l'aller-retour LLM complet. Les réponses sont conservées
+# pré-encodées en octets JSON, si bien qu'un hit se réduit à un envoi direct
+# sans re-sérialisation. Borné en taille (éviction LRU) et en durée de vie.
+_RESPONSE_CACHE_MAX_ENTRIES = 1024
+_RESPONSE_CACHE_TTL_SECONDS = 3600
+
+_response_cache: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def _response_cache_key(*parts: str) -> str:
+    """Clé de cache: empreinte blake2b des parties, séparées sans ambiguïté."""
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part.encode('utf-8'))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+def _response_cache_get(key: str) -> Optional[bytes]:
+    """Retourne les octets JSON mis en cache, ou None (expiré ou absent)."""
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+        if entry is None:
+            return None
+        created, body = entry
+        if time.time() - created > _RESPONSE_CACHE_TTL_SECONDS:
+            del _response_cache[key]
+            return None
+        _response_cache.move_to_end(key)
+        return body
+
+
+# Préchargement spéculatif: après une analyse, l'utilisateur demande très
+# souvent ensuite une génération sur le même texte. Les générations pour les
+# types de contre-arguments les plus plausibles sont lancées en arrière-plan
+# et déposées dans le cache de réponses; si le clic suivant correspond,
+# /generate répond depuis le cache. Le travail perdu est borné à
+# _PREFETCH_TOP_K appels LLM par analyse.
+_PREFETCH_TOP_K = 2
+
+_prefetch_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='prefetch')
+_prefetch_inflight: set = set()
+_prefetch_lock = threading.Lock()
+
+
+def _predict_top_k(vulnerabilities: List[Any], k: int = _PREFETCH_TOP_K) -> List[CounterArgumentType]:
+    """
+    Prédit les k types de contre-arguments les plus plausibles.
+
+    Les types suggérés par les vulnérabilités sont classés par somme des
+    scores; à défaut de vulnérabilité, la réfutation directe (le choix par
+    défaut de l'agent) est retournée seule.
+    """
+    scores: Dict[CounterArgumentType, float] = {}
+    for v in vulnerabilities:
+        scores[v.suggested_counter_type] = scores.get(v.suggested_counter_type, 0.0) + v.score
+    if not scores:
+        return [CounterArgumentType.DIRECT_REFUTATION][:k]
+    return sorted(scores, key=scores.get, reverse=True)[:k]
+
+
+def _is_fallback_result(result: Dict[str, Any]) -> bool:
+    """Vrai si le résultat est une réponse de repli (erreur LLM ou décodage).
+
+    L'agent ne lève jamais: en cas d'échec il retourne un contre-argument
+    de repli, signalé par un target_component hors structure ('error' pour
+    une exception, 'unknown' pour un JSON indécodable). Ces réponses ne
+    doivent pas entrer dans le cache, sinon une panne transitoire de l'API
+    serait resservie pendant toute la durée de vie de l'entrée.
+    """
+    return result['counter_argument'].target_component in ('error', 'unknown')
+
+
+def _prefetch_one(agent: CounterArgumentAgent, argument_text: str, counter_type: CounterArgumentType, cache_key: str) -> None:
+    """Génère un contre-argument en arrière-plan et alimente le cache de réponses."""
+    try:
+        # record_metrics=False: une génération spéculative n'est pas une
+        # requête utilisateur, elle ne doit pas compter dans /api/metrics
+        result = agent.generate_counter_argument(
+            argument_text, counter_type=counter_type, record_metrics=False
+        )
+        if _is_fallback_result(result):
+            logger.debug(f"Préchargement non mis en cache (repli) pour {counter_type.value}")
+            return
+        body = _json_dumps_bytes(_format_generation_response(result))
+        _response_cache_put(cache_key, body)
+        logger.debug(f"Préchargement terminé pour le type {counter_type.value}")
+    except Exception as e:
+        # Le préchargement est opportuniste: une erreur ici ne doit jamais
+        # remonter, la requête /generate réelle réessaiera normalement
+        logger.debug(f"Préchargement abandonné pour {counter_type.value}: {e}")
+    finally:
+        with _prefetch_lock:
+            _prefetch_inflight.discard(cache_key)
+
+
+def _schedule_prefetch(agent: CounterArgumentAgent, argument_text: str, vulnerabilities: List[Any]) -> None:
+    """Planifie les générations spéculatives pour les types les plus plausibles."""
+    normalized = ' '.join(argument_text.split())
+    for counter_type in _predict_top_k(vulnerabilities):
+        # Même clé que celle qu'utilisera /generate pour (texte, type, sans
+        # stratégie), afin que le hit soit transparent
+        cache_key = _response_cache_key('generate', normalized, counter_type.value, '')
+        if _response_cache_get(cache_key) is not None:
+            continue
+        with _prefetch_lock:
+            if cache_key in _prefetch_inflight:
+                continue
+            _prefetch_inflight.add(cache_key)
+        _prefetch_executor.submit(_prefetch_one, agent, argument_text, counter_type, cache_key)
+
+
+def _response_cache_put(key: str, body: bytes) -> None:
+    """Insère une réponse encodée, en évinçant la plus ancienne si besoin."""
+    with _response_cache_lock:
+        _response_cache[key] = (time.time(), body)
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > _RESPONSE_CACHE_MAX_ENTRIES:
+            _response_cache.popitem(last=False)
+
+# Octets de la page d'accueil rendue: le template n'a aucun contexte
+# dynamique, inutile de repasser par Jinja2 à chaque GET. Rendu
+# paresseusement au premier accès (l'application doit être démarrée pour
+# disposer d'un contexte de requête).
+_index_html: Optional[bytes] = None
+
+
 @app.route('/')
 def index():
     """Page d'accueil."""
-    return render_template('index.html')
+    # En mode debug, rendre à chaque fois pour voir les modifications du template
+    if app.debug:
+        return render_template('index.html')
+    global _index_html
+    if _index_html is None:
+        _index_html = render_template('index.html').encode('utf-8')
+    return Response(_index_html, mimetype='text/html')
 
 
 @app.route('/analyze', methods=['POST'])
@@ -57,10 +251,14 @@ def analyze_argument():
         if not argument_text:
             return jsonify({'error': 'Argument manquant'}), 400
         
-        # Initialiser l'agent si nécessaire
-        global agent, agent_config
-        if agent is None:
-            agent = CounterArgumentAgent(agent_config)
+        # Consulter le cache sur le texte normalisé (les espaces superflus
+        # ne changent pas l'analyse)
+        cache_key = _response_cache_key('analyze', ' '.join(argument_text.split()))
+        cached = _response_cache_get(cache_key)
+        if cached is not None:
+            return Response(cached, mimetype='application/json')
+        
+        agent = _get_agent()
         
         # Analyser l'argument
         argument = agent.parser.parse_argument(argument_text)
@@ -68,7 +266,7 @@ def analyze_argument():
         # Identifier les vulnérabilités
         vulnerabilities = agent.parser.identify_vulnerabilities(argument)
         
-        return jsonify({
+        body = _json_dumps_bytes({
             'argument': {
                 'content': argument.content,
                 'premises': argument.premises,
@@ -85,10 +283,16 @@ def analyze_argument():
                 for v in vulnerabilities
             ]
         })
+        _response_cache_put(cache_key, body)
+        
+        # Lancer les générations spéculatives pour les types les plus
+        # plausibles pendant que l'utilisateur lit l'analyse
+        _schedule_prefetch(agent, argument_text, vulnerabilities)
+        
+        return Response(body, mimetype='application/json')
     
     except Exception as e:
-        logger.error(f"Erreur lors de l'analyse: {e}")
-        traceback.print_exc()
+        logger.exception("Erreur lors de l'analyse")
         return jsonify({'error': str(e)}), 500
 
 
@@ -118,149 +322,206 @@ def generate_counter_argument():
         # Convertir les chaînes en énumérations
         counter_type = None
         if counter_type_str:
-            try:
-                counter_type = CounterArgumentType(counter_type_str)
-            except ValueError:
+            counter_type = _CT_BY_VALUE.get(counter_type_str)
+            if counter_type is None:
                 return jsonify({'error': f'Type de contre-argument invalide: {counter_type_str}'}), 400
         
         rhetorical_strategy = None
         if rhetorical_strategy_str:
-            try:
-                rhetorical_strategy = RhetoricalStrategy(rhetorical_strategy_str)
-            except ValueError:
+            rhetorical_strategy = _RS_BY_VALUE.get(rhetorical_strategy_str)
+            if rhetorical_strategy is None:
                 return jsonify({'error': f'Stratégie rhétorique invalide: {rhetorical_strategy_str}'}), 400
         
-        # Initialiser l'agent si nécessaire
-        global agent, agent_config
-        if agent is None:
-            agent = CounterArgumentAgent(agent_config)
+        # Consulter le cache (texte normalisé + paramètres de génération)
+        cache_key = _response_cache_key(
+            'generate',
+            ' '.join(argument_text.split()),
+            counter_type_str or '',
+            rhetorical_strategy_str or ''
+        )
+        cached = _response_cache_get(cache_key)
+        if cached is not None:
+            return Response(cached, mimetype='application/json')
         
         # Générer le contre-argument
-        result = agent.generate_counter_argument(
+        result = _get_agent().generate_counter_argument(
             argument_text,
             counter_type=counter_type,
             rhetorical_strategy=rhetorical_strategy
         )
         
         # Formater la réponse
-        response = {
-            'original_argument': {
-                'content': result['original_argument'].content,
-                'premises': result['original_argument'].premises,
-                'conclusion': result['original_argument'].conclusion,
-                'argument_type': result['original_argument'].argument_type
-            },
-            'counter_argument': {
-                'content': result['counter_argument'].counter_content,
-                'type': result['counter_argument'].counter_type.value,
-                'target_component': result['counter_argument'].target_component,
-                'strength': result['counter_argument'].strength.value,
-                'rhetorical_strategy': result['counter_argument'].rhetorical_strategy
-            },
-            'vulnerabilities': [
-                {
-                    'type': v.type,
-                    'target': v.target,
-                    'score': v.score,
-                    'description': v.description
-                }
-                for v in result.get('vulnerabilities', [])
-            ],
-            'evaluation': {
-                'relevance': result['evaluation'].relevance,
-                'logical_strength': result['evaluation'].logical_strength,
-                'persuasiveness': result['evaluation'].persuasiveness,
-                'originality': result['evaluation'].originality,
-                'clarity': result['evaluation'].clarity,
-                'overall_score': result['evaluation'].overall_score,
-                'recommendations': result['evaluation'].recommendations
-            },
-            'validation': {
-                'is_valid_attack': result['validation'].is_valid_attack,
-                'original_survives': result['validation'].original_survives,
-                'counter_succeeds': result['validation'].counter_succeeds,
-                'logical_consistency': result['validation'].logical_consistency
-            }
-        }
+        response = _format_generation_response(result)
         
-        if hasattr(result['validation'], 'formal_representation'):
-            response['validation']['formal_representation'] = result['validation'].formal_representation
-        
-        return jsonify(response)
+        body = _json_dumps_bytes(response)
+        # Ne pas mettre en cache les réponses de repli: l'utilisateur doit
+        # pouvoir réessayer dès que l'API redevient disponible
+        if not _is_fallback_result(result):
+            _response_cache_put(cache_key, body)
+        return Response(body, mimetype='application/json')
     
     except Exception as e:
-        logger.error(f"Erreur lors de la génération: {e}")
-        traceback.print_exc()
+        logger.exception("Erreur lors de la génération")
         return jsonify({'error': str(e)}), 500
 
 
+def _format_generation_response(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Formate le résultat de génération de l'agent en dictionnaire JSON-compatible."""
+    # Argument, EvaluationResult et ValidationResult sont des dataclasses dont
+    # les noms de champs correspondent exactement au format de l'API: asdict
+    # remplace la recopie champ par champ. CounterArgument et Vulnerability
+    # restent construits à la main car l'API les expose sous d'autres noms
+    # ('content' pour counter_content, etc.) et avec des champs convertis.
+    response = {
+        'original_argument': asdict(result['original_argument']),
+        'counter_argument': {
+            'content': result['counter_argument'].counter_content,
+            'type': result['counter_argument'].counter_type.value,
+            'target_component': result['counter_argument'].target_component,
+            'strength': result['counter_argument'].strength.value,
+            'rhetorical_strategy': result['counter_argument'].rhetorical_strategy
+        },
+        'vulnerabilities': [
+            {
+                'type': v.type,
+                'target': v.target,
+                'score': v.score,
+                'description': v.description
+            }
+            for v in result.get('vulnerabilities', [])
+        ],
+        'evaluation': asdict(result['evaluation']),
+        'validation': asdict(result['validation'])
+    }
+    
+    # str() force la matérialisation de la représentation paresseuse
+    response['validation']['formal_representation'] = str(result['validation'].formal_representation)
+    
+    return response
+
+
+@app.route('/generate/stream', methods=['POST'])
+def generate_counter_argument_stream():
+    """
+    Génère un contre-argument en diffusant la rédaction via Server-Sent Events.
+    
+    Même requête JSON que /generate. La réponse est un flux text/event-stream:
+    une trame {"delta": "..."} par fragment émis par le LLM, puis une trame
+    finale {"done": true, "result": {...}} au même format que /generate. Le
+    client voit ainsi le premier token à la latence du premier token, au lieu
+    d'attendre la génération complète.
+    """
+    data = request.json
+    argument_text = data.get('argument', '')
+    
+    if not argument_text:
+        return jsonify({'error': 'Argument manquant'}), 400
+    
+    counter_type_str = data.get('counter_type')
+    rhetorical_strategy_str = data.get('rhetorical_strategy')
+    
+    counter_type = None
+    if counter_type_str:
+        counter_type = _CT_BY_VALUE.get(counter_type_str)
+        if counter_type is None:
+            return jsonify({'error': f'Type de contre-argument invalide: {counter_type_str}'}), 400
+    
+    rhetorical_strategy = None
+    if rhetorical_strategy_str:
+        rhetorical_strategy = _RS_BY_VALUE.get(rhetorical_strategy_str)
+        if rhetorical_strategy is None:
+            return jsonify({'error': f'Stratégie rhétorique invalide: {rhetorical_strategy_str}'}), 400
+    
+    agent = _get_agent()
+    
+    def _event_stream():
+        try:
+            for kind, payload in agent.generate_counter_argument_stream(
+                argument_text,
+                counter_type=counter_type,
+                rhetorical_strategy=rhetorical_strategy
+            ):
+                if kind == 'delta':
+                    yield 'data: ' + json.dumps({'delta': payload}) + '\n\n'
+                else:
+                    response = _format_generation_response(payload)
+                    yield 'data: ' + json.dumps({'done': True, 'result': response}) + '\n\n'
+        except Exception as e:
+            logger.exception("Erreur lors de la génération en flux")
+            yield 'data: ' + json.dumps({'error': str(e)}) + '\n\n'
+    
+    return Response(stream_with_context(_event_stream()), mimetype='text/event-stream')
+
+
 @app.route('/api/counter_types', methods=['GET'])
 def get_counter_types():
     """Retourne la liste des types de contre-arguments disponibles."""
-    counter_types = [
-        {
-            'value': ct.value,
-            'name': ct.value.replace('_', ' ').title(),
-            'description': _get_counter_type_description(ct)
-        }
-        for ct in CounterArgumentType
-    ]
-    
-    return jsonify(counter_types)
+    return Response(_COUNTER_TYPES_JSON, mimetype='application/json')
 
 
 @app.route('/api/rhetorical_strategies', methods=['GET'])
 def get_rhetorical_strategies():
     """Retourne la liste des stratégies rhétoriques disponibles."""
-    strategies = [
-        {
-            'value': rs.value,
-            'name': rs.value.replace('_', ' ').title(),
-            'description': _get_strategy_description(rs)
-        }
-        for rs in RhetoricalStrategy
-    ]
-    
-    return jsonify(strategies)
+    return Response(_STRATEGIES_JSON, mimetype='application/json')
 
 
 @app.route('/api/metrics', methods=['GET'])
 def get_metrics():
     """Retourne les métriques de performance de l'agent."""
-    global agent, agent_config
-    
-    if agent is None:
-        agent = CounterArgumentAgent(agent_config)
-    
-    metrics = agent.metrics.get_summary_metrics()
+    metrics = _get_agent().metrics.get_summary_metrics()
     
     return jsonify(metrics)
 
 
+# Descriptions des énumérations, construites une seule fois au chargement du
+# module; MappingProxyType fige les tables en lecture seule, une mutation
+# accidentelle invaliderait les réponses JSON pré-sérialisées plus bas
+_COUNTER_TYPE_DESCRIPTIONS: Mapping[CounterArgumentType, str] = MappingProxyType({
+    CounterArgumentType.DIRECT_REFUTATION: "Attaque directement la conclusion de l'argument en montrant qu'elle est fausse.",
+    CounterArgumentType.COUNTER_EXAMPLE: "Fournit un exemple qui contredit une généralisation faite dans l'argument.",
+    CounterArgumentType.ALTERNATIVE_EXPLANATION: "Propose une explication alternative qui rend compte des mêmes faits.",
+    CounterArgumentType.PREMISE_CHALLENGE: "Remet en question la validité d'une ou plusieurs prémisses de l'argument.",
+    CounterArgumentType.REDUCTIO_AD_ABSURDUM: "Montre que l'argument mène à des conséquences absurdes ou contradictoires."
+})
+
+_STRATEGY_DESCRIPTIONS: Mapping[RhetoricalStrategy, str] = MappingProxyType({
+    RhetoricalStrategy.SOCRATIC_QUESTIONING: "Pose des questions qui exposent les failles dans le raisonnement.",
+    RhetoricalStrategy.REDUCTIO_AD_ABSURDUM: "Pousse le raisonnement jusqu'à l'absurde pour montrer ses limites.",
+    RhetoricalStrategy.ANALOGICAL_COUNTER: "Utilise une analogie pour montrer les failles de l'argument.",
+    RhetoricalStrategy.AUTHORITY_APPEAL: "Fait appel à une autorité reconnue pour contredire l'argument.",
+    RhetoricalStrategy.STATISTICAL_EVIDENCE: "Utilise des données statistiques pour contredire l'argument."
+})
+
+# Réponses JSON des points d'API statiques, sérialisées une fois: les
+# énumérations et leurs descriptions sont immuables, chaque requête se
+# réduit donc à l'envoi des octets pré-encodés
+_COUNTER_TYPES_JSON = _json_dumps_bytes([
+    {
+        'value': ct.value,
+        'name': ct.value.replace('_', ' ').title(),
+        'description': _COUNTER_TYPE_DESCRIPTIONS.get(ct, "Description non disponible.")
+    }
+    for ct in CounterArgumentType
+])
+
+_STRATEGIES_JSON = _json_dumps_bytes([
+    {
+        'value': rs.value,
+        'name': rs.value.replace('_', ' ').title(),
+        'description': _STRATEGY_DESCRIPTIONS.get(rs, "Description non disponible.")
+    }
+    for rs in RhetoricalStrategy
+])
+
+
 def _get_counter_type_description(counter_type: CounterArgumentType) -> str:
     """Retourne une description du type de contre-argument."""
-    descriptions = {
-        CounterArgumentType.DIRECT_REFUTATION: "Attaque directement la conclusion de l'argument en montrant qu'elle est fausse.",
-        CounterArgumentType.COUNTER_EXAMPLE: "Fournit un exemple qui contredit une généralisation faite dans l'argument.",
-        CounterArgumentType.ALTERNATIVE_EXPLANATION: "Propose une explication alternative qui rend compte des mêmes faits.",
-        CounterArgumentType.PREMISE_CHALLENGE: "Remet en question la validité d'une ou plusieurs prémisses de l'argument.",
-        CounterArgumentType.REDUCTIO_AD_ABSURDUM: "Montre que l'argument mène à des conséquences absurdes ou contradictoires."
-    }
-    
-    return descriptions.get(counter_type, "Description non disponible.")
+    return _COUNTER_TYPE_DESCRIPTIONS.get(counter_type, "Description non disponible.")
 
 
 def _get_strategy_description(strategy: RhetoricalStrategy) -> str:
     """Retourne une description de la stratégie rhétorique."""
-    descriptions = {
-        RhetoricalStrategy.SOCRATIC_QUESTIONING: "Pose des questions qui exposent les failles dans le raisonnement.",
-        RhetoricalStrategy.REDUCTIO_AD_ABSURDUM: "Pousse le raisonnement jusqu'à l'absurde pour montrer ses limites.",
-        RhetoricalStrategy.ANALOGICAL_COUNTER: "Utilise une analogie pour montrer les failles de l'argument.",
-        RhetoricalStrategy.AUTHORITY_APPEAL: "Fait appel à une autorité reconnue pour contredire l'argument.",
-        RhetoricalStrategy.STATISTICAL_EVIDENCE: "Utilise des données statistiques pour contredire l'argument."
-    }
-    
-    return descriptions.get(strategy, "Description non disponible.")
+    return _STRATEGY_DESCRIPTIONS.get(strategy, "Description non disponible.")
 
 
 def start_app(host='0.0.0.0', port=5000, debug=False, config=None):
@@ -277,13 +538,28 @@ def start_app(host='0.0.0.0', port=5000, debug=False, config=None):
     global agent_config
     agent_config = config
     
-    # Si l'agent est déjà initialisé et que la config a changé, le réinitialiser
+    # Construire l'agent avant le démarrage du serveur: les requêtes ne
+    # paient ainsi jamais l'initialisation (JVM, clients LLM), et il n'y a
+    # aucune course de première requête. Reconstruit si la config change.
     global agent
-    if agent is not None and config is not None:
-        agent = CounterArgumentAgent(config)
+    with _agent_lock:
+        if agent is None or config is not None:
+            agent = CounterArgumentAgent(config)
     
-    # Démarrer l'application
-    app.run(host=host, port=port, debug=debug)
+    # Démarrer l'application. Hors debug, servir via waitress: le serveur de
+    # développement Flask traite les requêtes en série, et /generate bloque
+    # plusieurs secondes sur OpenAI — un pool de threads permet aux appels
+    # concurrents de recouvrir leurs entrées/sorties LLM.
+    if debug:
+        app.run(host=host, port=port, debug=True)
+        return
+    try:
+        from waitress import serve
+    except ImportError:
+        logger.warning("waitress non disponible, utilisation du serveur de développement Flask")
+        app.run(host=host, port=port, debug=False)
+        return
+    serve(app, host=host, port=port, threads=16)
 
 
 if __name__ == '__main__':
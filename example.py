@@ -9,11 +9,12 @@ import os
 import sys
 import logging
 import time
-from pprint import pprint
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
 
-# Charger les variables d'environnement depuis le fichier .env s'il existe
-load_dotenv()
+# L'import du paquet charge .env si la clé API manque de l'environnement
+# (voir counter_agent.llm.llm_generator): pas de chargement redondant ici
+from counter_agent.agent.counter_agent import CounterArgumentAgent
+from counter_agent.agent.definitions import CounterArgumentType, RhetoricalStrategy
 
 # Vérifier la présence de la clé API OpenAI
 if 'OPENAI_API_KEY' not in os.environ:
@@ -24,12 +25,6 @@ if 'OPENAI_API_KEY' not in os.environ:
     print("    Ou fournissez votre clé API comme argument: --api-key=votre-clé-api")
     print()
 
-# Ajouter le répertoire parent au sys.path
-sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
-
-from counter_agent.agent.counter_agent import CounterArgumentAgent
-from counter_agent.agent.definitions import CounterArgumentType, RhetoricalStrategy
-
 
 # Configuration du logging
 logging.basicConfig(
@@ -78,49 +73,61 @@ def main():
         }
     ]
     
-    # Tester l'agent sur chaque argument
-    for test_arg in test_arguments:
-        print("\n" + "=" * 80)
-        print(f"Test de l'argument: {test_arg['name']}")
-        print("=" * 80)
-        
-        # Générer un contre-argument
-        print(f"\nArgument original: {test_arg['text']}")
-        print("\nGénération du contre-argument...")
-        
+    # Générer les contre-arguments en parallèle: chaque génération bloque
+    # sur un appel OpenAI, le temps total passe donc de la somme des
+    # latences au maximum des latences
+    def _generate(test_arg):
         start_time = time.time()
         result = agent.generate_counter_argument(test_arg['text'])
-        generation_time = time.time() - start_time
-        
-        # Afficher les résultats
-        print(f"\nContre-argument généré ({generation_time:.2f} secondes):")
-        print("-" * 50)
-        print(result['counter_argument'].counter_content)
-        print("-" * 50)
-        
-        print("\nInformations sur le contre-argument:")
-        print(f"- Type: {result['counter_argument'].counter_type.value}")
-        print(f"- Cible: {result['counter_argument'].target_component}")
-        print(f"- Force: {result['counter_argument'].strength.value}")
-        print(f"- Stratégie rhétorique: {result['counter_argument'].rhetorical_strategy}")
-        
-        print("\nÉvaluation:")
-        print(f"- Score global: {result['evaluation'].overall_score:.2f}")
-        print(f"- Pertinence: {result['evaluation'].relevance:.2f}")
-        print(f"- Force logique: {result['evaluation'].logical_strength:.2f}")
-        print(f"- Persuasion: {result['evaluation'].persuasiveness:.2f}")
-        print(f"- Originalité: {result['evaluation'].originality:.2f}")
-        print(f"- Clarté: {result['evaluation'].clarity:.2f}")
-        
-        print("\nRecommandations:")
-        for recommendation in result['evaluation'].recommendations:
-            print(f"- {recommendation}")
-        
-        print("\nValidation logique:")
-        print(f"- Attaque valide: {result['validation'].is_valid_attack}")
-        print(f"- L'argument original survit: {result['validation'].original_survives}")
-        print(f"- Le contre-argument réussit: {result['validation'].counter_succeeds}")
-        print(f"- Cohérence logique: {result['validation'].logical_consistency}")
+        return result, time.time() - start_time
+    
+    print("\nGénération des contre-arguments en parallèle...")
+    with ThreadPoolExecutor(max_workers=len(test_arguments)) as executor:
+        generations = list(executor.map(_generate, test_arguments))
+    
+    # Afficher les résultats dans l'ordre des arguments: la sortie de chaque
+    # argument est assemblée en une seule chaîne et écrite d'un bloc, au lieu
+    # d'une vingtaine de print() qui purgent chacun le tampon de stdout
+    for test_arg, (result, generation_time) in zip(test_arguments, generations):
+        lines = [
+            "",
+            "=" * 80,
+            f"Test de l'argument: {test_arg['name']}",
+            "=" * 80,
+            "",
+            f"Argument original: {test_arg['text']}",
+            "",
+            f"Contre-argument généré ({generation_time:.2f} secondes):",
+            "-" * 50,
+            result['counter_argument'].counter_content,
+            "-" * 50,
+            "",
+            "Informations sur le contre-argument:",
+            f"- Type: {result['counter_argument'].counter_type.value}",
+            f"- Cible: {result['counter_argument'].target_component}",
+            f"- Force: {result['counter_argument'].strength.value}",
+            f"- Stratégie rhétorique: {result['counter_argument'].rhetorical_strategy}",
+            "",
+            "Évaluation:",
+            f"- Score global: {result['evaluation'].overall_score:.2f}",
+            f"- Pertinence: {result['evaluation'].relevance:.2f}",
+            f"- Force logique: {result['evaluation'].logical_strength:.2f}",
+            f"- Persuasion: {result['evaluation'].persuasiveness:.2f}",
+            f"- Originalité: {result['evaluation'].originality:.2f}",
+            f"- Clarté: {result['evaluation'].clarity:.2f}",
+            "",
+            "Recommandations:",
+        ]
+        lines.extend(f"- {recommendation}" for recommendation in result['evaluation'].recommendations)
+        lines.extend([
+            "",
+            "Validation logique:",
+            f"- Attaque valide: {result['validation'].is_valid_attack}",
+            f"- L'argument original survit: {result['validation'].original_survives}",
+            f"- Le contre-argument réussit: {result['validation'].counter_succeeds}",
+            f"- Cohérence logique: {result['validation'].logical_consistency}",
+        ])
+        sys.stdout.write("\n".join(lines) + "\n")
     
     # Afficher les métriques globales
     print("\n" + "=" * 80)
@@ -134,9 +141,9 @@ def main():
     print(f"- Score global moyen: {summary['average_overall_score']:.3f}")
     print(f"- Temps de génération moyen: {summary['average_generation_time']:.3f} secondes")
     
-    # Exporter un rapport complet
+    # Exporter un rapport complet (gros tampon: une écriture, une purge)
     report = agent.metrics.export_metrics_report()
-    with open('metrics_report.txt', 'w') as f:
+    with open('metrics_report.txt', 'w', buffering=1 << 20) as f:
         f.write(report)
     
     print("\nRapport de métriques exporté dans 'metrics_report.txt'")
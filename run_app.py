@@ -6,13 +6,12 @@ Ce script configure le logging et démarre l'application web.
 """
 
 import os
-import sys
 import logging
 import argparse
-from dotenv import load_dotenv
 
-# Charger les variables d'environnement depuis le fichier .env s'il existe
-load_dotenv()
+# L'import du paquet charge .env si la clé API manque de l'environnement
+# (voir counter_agent.llm.llm_generator): pas de chargement redondant ici
+from counter_agent.ui import start_app
 
 # Vérifier la présence de la clé API OpenAI
 if 'OPENAI_API_KEY' not in os.environ:
@@ -21,22 +20,20 @@ if 'OPENAI_API_KEY' not in os.environ:
     print("    Créez un fichier .env à la racine du projet avec votre clé API:")
     print("    OPENAI_API_KEY=votre-clé-api-openai")
 
-# Ajouter le répertoire parent au sys.path
-sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
-
-from counter_agent.ui import start_app
-
 
 def setup_logging(level=logging.INFO):
     """Configure le logging pour l'application."""
-    logging.basicConfig(
-        level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler('counter_agent.log')
-        ]
-    )
+    # Configuration explicite du logger racine: basicConfig est un no-op dès
+    # que des handlers existent (il suffisait qu'un module importé en ait
+    # installé un), ce qui empêchait silencieusement le FileHandler de
+    # s'attacher. Ici les handlers sont posés inconditionnellement.
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    root = logging.getLogger()
+    root.handlers.clear()
+    root.setLevel(level)
+    for handler in (logging.StreamHandler(), logging.FileHandler('counter_agent.log')):
+        handler.setFormatter(formatter)
+        root.addHandler(handler)
 
 
 def parse_arguments():